@@ -7,6 +7,7 @@ from .pipeline_functions import (
     run_dbt_deps,
     run_dbt_models,
     run_dbt_tests,
+    run_dbt_build,
     generate_dbt_docs,
     validate_data_quality,
     get_project_paths
@@ -17,6 +18,7 @@ from .config import (
     DEFAULT_ARGS,
     TASK_CONFIG,
     ENV_VARS,
+    POOL_CONFIG,
     DATA_QUALITY_THRESHOLDS
 )
 
@@ -26,6 +28,7 @@ __all__ = [
     'run_dbt_deps', 
     'run_dbt_models',
     'run_dbt_tests',
+    'run_dbt_build',
     'generate_dbt_docs',
     'validate_data_quality',
     'get_project_paths',
@@ -35,5 +38,6 @@ __all__ = [
     'DEFAULT_ARGS', 
     'TASK_CONFIG',
     'ENV_VARS',
+    'POOL_CONFIG',
     'DATA_QUALITY_THRESHOLDS'
 ]
@@ -2,7 +2,7 @@
 Configuration settings for the Airflow pipeline.
 """
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 # DAG Configuration
 DAG_CONFIG = {
@@ -17,6 +17,7 @@ DAG_CONFIG = {
 DEFAULT_ARGS = {
     'owner': 'data_engineer',
     'depends_on_past': False,
+    'start_date': datetime(2024, 1, 1),  # static: a moving start_date changes on every DAG parse
     'email_on_failure': False,
     'email_on_retry': False,
     'retries': 1,
@@ -48,6 +49,10 @@ TASK_CONFIG = {
         'task_id': 'dbt_run_tests',
         'description': 'Run dbt tests for data quality validation',
     },
+    'dbt_build': {
+        'task_id': 'dbt_build',
+        'description': 'Run dbt models and tests in a single dbt build',
+    },
     'data_quality': {
         'task_id': 'validate_data_quality',
         'description': 'Additional data quality checks',
@@ -58,6 +63,15 @@ TASK_CONFIG = {
     },
 }
 
+# Airflow Pools
+POOL_CONFIG = {
+    'dbt': {
+        'name': 'dbt_pool',
+        'slots': 2,
+        'description': 'Limits concurrent dbt invocations across DAGs',
+    },
+}
+
 # Data Quality Thresholds
 DATA_QUALITY_THRESHOLDS = {
     'min_raw_rows': 1,
@@ -65,3 +79,13 @@ DATA_QUALITY_THRESHOLDS = {
     'min_gold_rows': 1,
     'max_duplicate_loan_ids': 0,
 }
+
+
+if __name__ == '__main__':
+    # Prints POOL_CONFIG in `airflow pools import` format; airflow-init runs
+    # this file directly so the pools are created from this single definition
+    import json
+    print(json.dumps({
+        pool['name']: {'slots': pool['slots'], 'description': pool['description']}
+        for pool in POOL_CONFIG.values()
+    }, indent=2))
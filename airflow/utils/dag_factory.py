@@ -0,0 +1,70 @@
+"""
+DAG factory shared by the full-refresh and incremental loan pipelines.
+"""
+
+from airflow import DAG
+from airflow.operators.python import PythonOperator
+
+from .pipeline_functions import (
+    run_ingestion,
+    run_dbt_deps,
+    run_dbt_build,
+    generate_dbt_docs,
+    validate_data_quality
+)
+from .config import DAG_CONFIG, DEFAULT_ARGS, TASK_CONFIG, POOL_CONFIG
+
+
+def build_loan_dag(dag_id, mode, schedule, tags, description, ingest_task_id=None) -> DAG:
+    """Build the loan pipeline DAG for the given ingestion mode"""
+    dag = DAG(
+        dag_id,
+        default_args=DEFAULT_ARGS,
+        description=description,
+        schedule=schedule,
+        catchup=DAG_CONFIG['catchup'],
+        tags=tags,
+    )
+
+    # Task definitions
+    ingest_task = PythonOperator(
+        task_id=ingest_task_id or TASK_CONFIG['ingest']['task_id'],
+        python_callable=run_ingestion,
+        params={'mode': mode},
+        dag=dag,
+    )
+
+    dbt_deps_task = PythonOperator(
+        task_id=TASK_CONFIG['dbt_deps']['task_id'],
+        python_callable=run_dbt_deps,
+        pool=POOL_CONFIG['dbt']['name'],
+        dag=dag,
+    )
+
+    dbt_build_task = PythonOperator(
+        task_id=TASK_CONFIG['dbt_build']['task_id'],
+        python_callable=run_dbt_build,
+        pool=POOL_CONFIG['dbt']['name'],
+        dag=dag,
+    )
+
+    data_quality_task = PythonOperator(
+        task_id=TASK_CONFIG['data_quality']['task_id'],
+        python_callable=validate_data_quality,
+        dag=dag,
+    )
+
+    dbt_docs_task = PythonOperator(
+        task_id=TASK_CONFIG['dbt_docs']['task_id'],
+        python_callable=generate_dbt_docs,
+        pool=POOL_CONFIG['dbt']['name'],
+        dag=dag,
+    )
+
+    # Task dependencies
+    # (dbt deps only depends on packages.yml, so it runs alongside ingestion.
+    # The data quality checks and dbt docs both open the DuckDB file, which takes
+    # one process at a time, so they stay serial)
+    [ingest_task, dbt_deps_task] >> dbt_build_task >> data_quality_task >> dbt_docs_task
+
+    return dag
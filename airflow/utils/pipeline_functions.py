@@ -3,14 +3,27 @@ Pipeline utility functions for Airflow DAGs.
 Contains all the business logic for the loan data pipeline.
 """
 
+import contextlib
+import functools
 import os
+import shutil
 import subprocess
+import sys
 from pathlib import Path
 from typing import Dict, Any
 
+# Make the project root importable so the ingestion module runs in-process
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(_PROJECT_ROOT))
 
+
+@functools.lru_cache(maxsize=1)
 def get_project_paths() -> Dict[str, Path]:
-    """Get all project paths relative to the current working directory."""
+    """Get all project paths relative to the current working directory.
+
+    The result is computed once and shared; callers must not mutate it.
+    """
     # Get the project root (2 levels up from airflow/utils)
     project_root = Path(__file__).parent.parent.parent
     return {
@@ -20,10 +33,69 @@ def get_project_paths() -> Dict[str, Path]:
         "duckdb_path": project_root / "dbt" / "data_challenge.duckdb",
         "raw_dir": project_root / "raw_data",
         "dbt_dir": project_root / "dbt",
+        "dbt_cache_dir": project_root / ".dbt_cache",  # Persists partial_parse.msgpack across task runs
         "ingest_script": project_root / "ingest" / "ingest_excel_to_duckdb.py"
     }
 
 
+@contextlib.contextmanager
+def duck_conn(read_only: bool = False):
+    """Open the project DuckDB database for one task, closing it on exit.
+
+    Closing releases the file lock before another process (e.g. dbt) opens
+    the file. memory_limit is applied only when DUCKDB_MEMORY_LIMIT is set.
+    """
+    # Imported here, not at module level, so DAG parsing doesn't load duckdb
+    import duckdb
+    
+    con = duckdb.connect(str(get_project_paths()["duckdb_path"]), read_only=read_only)
+    try:
+        memory_limit = os.getenv('DUCKDB_MEMORY_LIMIT')
+        if memory_limit:
+            con.execute("SET memory_limit = ?", [memory_limit])
+        con.execute("PRAGMA enable_object_cache")
+        con.execute("PRAGMA disable_progress_bar")
+        yield con
+    finally:
+        con.close()
+
+
+def run_streaming(cmd, cwd=None, env=None) -> None:
+    """Run a command streaming its combined stdout/stderr to the task log line by line.
+
+    Output is never buffered in memory and shows up in Airflow while the
+    command is still running. Raises CalledProcessError on a non-zero exit.
+    """
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        print(line, end="")
+    returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def run_dbt_command(cmd, paths: Dict[str, Path]) -> None:
+    """Run a dbt command reusing the cached partial parse manifest.
+
+    The cached manifest is restored into target/ before the command (unless
+    target/ already holds a newer one) and saved back after a successful run,
+    so dbt never has to fully re-parse the project on a fresh worker.
+    """
+    cache_file = paths["dbt_cache_dir"] / "partial_parse.msgpack"
+    target_file = paths["dbt_dir"] / "target" / "partial_parse.msgpack"
+    
+    if cache_file.exists() and (not target_file.exists() or cache_file.stat().st_mtime > target_file.stat().st_mtime):
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(cache_file, target_file)
+    
+    env = {**os.environ, "DBT_PARTIAL_PARSE": "true"}
+    run_streaming(cmd, cwd=str(paths["dbt_dir"]), env=env)
+    
+    if target_file.exists():
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(target_file, cache_file)
+
+
 def run_ingestion(**context) -> bool:
     """Run the ingestion step: Excel → RAW (Parquet + DuckDB)"""
     paths = get_project_paths()
@@ -32,8 +104,7 @@ def run_ingestion(**context) -> bool:
         # Get ingestion mode from context or environment
         ingestion_mode = context.get('params', {}).get('mode', os.getenv('INGESTION_MODE', 'full_refresh'))
         
-        cmd = [
-            "python", str(paths["ingest_script"]),
+        ingest_args = [
             "--duckdb", str(paths["duckdb_path"]),
             "--raw_dir", str(paths["raw_dir"]),
             "--mode", ingestion_mode,
@@ -41,29 +112,41 @@ def run_ingestion(**context) -> bool:
         
         # Add source (single file or directory)
         if ingestion_mode == 'incremental':
-            cmd.extend(["--excel_dir", str(paths["excel_dir"])])
+            ingest_args.extend(["--excel_dir", str(paths["excel_dir"])])
         else:
-            cmd.extend(["--excel", str(paths["excel_path"])])
+            ingest_args.extend(["--excel", str(paths["excel_path"])])
         
         # Add S3 upload if in production
         if os.getenv('ENVIRONMENT') == 'production':
             s3_bucket = os.getenv('RAW_S3_BUCKET')
             s3_prefix = os.getenv('RAW_S3_PREFIX', 'raw/loans')
             if s3_bucket:
-                cmd.extend(['--prod', '--s3_bucket', s3_bucket, '--s3_prefix', s3_prefix])
+                ingest_args.extend(['--prod', '--s3_bucket', s3_bucket, '--s3_prefix', s3_prefix])
         
         print(f"🚀 Running ingestion in {ingestion_mode} mode")
-        print(f"Command: {' '.join(cmd)}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Subprocess execution is kept only for process isolation
+        if os.getenv('INGESTION_SUBPROCESS', 'false').lower() == 'true':
+            cmd = ["python", str(paths["ingest_script"])] + ingest_args
+            print(f"Command: {' '.join(cmd)}")
+            run_streaming(cmd)
+        else:
+            print(f"Arguments: {' '.join(ingest_args)}")
+            # Imported here, not at module level, so DAG parsing doesn't load pandas/pyarrow
+            import ingest.ingest_excel_to_duckdb as ingest_module
+            try:
+                args = ingest_module.parser.parse_args(ingest_args)
+            except SystemExit as e:
+                # argparse exits on invalid arguments; surface it as a task error
+                raise ValueError(f"Invalid ingestion arguments: {' '.join(ingest_args)}") from e
+            with duck_conn() as con:
+                ingest_module.main(args, con)
+        
         print("✅ Ingestion completed successfully")
-        print(result.stdout)
         return True
         
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ Ingestion failed: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
         raise
 
 
@@ -73,7 +156,7 @@ def run_dbt_deps(**context) -> bool:
     
     try:
         cmd = ["dbt", "deps"]
-        result = subprocess.run(cmd, cwd=str(paths["dbt_dir"]), capture_output=True, text=True, check=True)
+        run_streaming(cmd, cwd=str(paths["dbt_dir"]))
         print("✅ dbt deps completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -87,14 +170,25 @@ def run_dbt_models(**context) -> bool:
     
     try:
         cmd = ["dbt", "run"]
-        result = subprocess.run(cmd, cwd=str(paths["dbt_dir"]), capture_output=True, text=True, check=True)
+        run_dbt_command(cmd, paths)
         print("✅ dbt run completed successfully")
-        print(result.stdout)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ dbt run failed: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+        raise
+
+
+def run_dbt_build(**context) -> bool:
+    """Run dbt models and tests in a single dbt invocation (one project parse)"""
+    paths = get_project_paths()
+    
+    try:
+        cmd = ["dbt", "build"]
+        run_dbt_command(cmd, paths)
+        print("✅ dbt build completed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ dbt build failed: {e}")
         raise
 
 
@@ -104,14 +198,11 @@ def run_dbt_tests(**context) -> bool:
     
     try:
         cmd = ["dbt", "test"]
-        result = subprocess.run(cmd, cwd=str(paths["dbt_dir"]), capture_output=True, text=True, check=True)
+        run_dbt_command(cmd, paths)
         print("✅ dbt tests completed successfully")
-        print(result.stdout)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ dbt tests failed: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
         raise
 
 
@@ -121,7 +212,7 @@ def generate_dbt_docs(**context) -> bool:
     
     try:
         cmd = ["dbt", "docs", "generate"]
-        result = subprocess.run(cmd, cwd=str(paths["dbt_dir"]), capture_output=True, text=True, check=True)
+        run_dbt_command(cmd, paths)
         print("✅ dbt docs generated successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -131,18 +222,15 @@ def generate_dbt_docs(**context) -> bool:
 
 def validate_data_quality(**context) -> bool:
     """Additional data quality checks beyond dbt tests"""
-    paths = get_project_paths()
-    
     try:
         # Example: Check if tables have data
-        import duckdb
-        
-        con = duckdb.connect(str(paths["duckdb_path"]))
-        
-        # Check row counts
-        raw_count = con.execute("SELECT COUNT(*) FROM raw.raw_loans").fetchone()[0]
-        silver_count = con.execute("SELECT COUNT(*) FROM silver.silver_loans").fetchone()[0]
-        gold_count = con.execute("SELECT COUNT(*) FROM gold.fact_loan").fetchone()[0]
+        with duck_conn(read_only=True) as con:
+            # Check row counts (single round-trip for all layers)
+            raw_count, silver_count, gold_count = con.execute("""
+                SELECT (SELECT COUNT(*) FROM raw.raw_loans),
+                       (SELECT COUNT(*) FROM silver.silver_loans),
+                       (SELECT COUNT(*) FROM gold.fact_loan)
+            """).fetchone()
         
         print(f"📊 Data counts: RAW={raw_count}, SILVER={silver_count}, GOLD={gold_count}")
         
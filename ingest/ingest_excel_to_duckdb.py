@@ -1,23 +1,32 @@
 import argparse
+import functools
+import hashlib
 import os
 from pathlib import Path
 import uuid
 import pandas as pd
 import duckdb
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import glob
 
 try:
     import pyarrow as pa  # noqa: F401
-    import pyarrow.parquet as pq
 except Exception:
-    pq = None
+    pa = None
 
 try:
     import boto3  # noqa: F401
+    from boto3.s3.transfer import TransferConfig
 except Exception:
     boto3 = None
 
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'  # Rust-backed reader, releases the GIL while parsing
+except Exception:
+    EXCEL_ENGINE = None  # pandas default (openpyxl)
+
 parser = argparse.ArgumentParser(description='Excel to DuckDB ingestion with full refresh and incremental modes')
 parser.add_argument('--excel', help='Path to source Excel file (single file)')
 parser.add_argument('--excel_dir', help='Directory containing Excel files (incremental mode)')
@@ -30,22 +39,114 @@ parser.add_argument('--mode', choices=['full_refresh', 'incremental'], default='
 parser.add_argument('--prod', action='store_true', help='If specified, upload Parquet files to S3')
 parser.add_argument('--s3_bucket', required=False, default=os.getenv('RAW_S3_BUCKET', ''), help='S3 bucket for RAW data')
 parser.add_argument('--s3_prefix', required=False, default=os.getenv('RAW_S3_PREFIX', 'raw/loans'), help='S3 prefix (folder)')
-args = parser.parse_args()
 
-def load_excel_files(excel_path=None, excel_dir=None, excel_pattern=None):
-    """Load Excel files and return combined DataFrame"""
-    dfs = []
-    
+# Files already loaded into the RAW table, used by incremental mode to skip unchanged files
+INGESTION_LOG_DDL = """
+    CREATE TABLE IF NOT EXISTS raw._ingestion_log (
+        source_file VARCHAR PRIMARY KEY,
+        sha256 VARCHAR,
+        file_size BIGINT,
+        mtime TIMESTAMP,
+        row_count BIGINT
+    )
+"""
+
+# DuckDB COPY options for the RAW Parquet artifacts. ZSTD + dictionary encoding
+# (on by default) shrinks the many low-cardinality text columns; row-group
+# statistics (also default) let read_parquet skip groups on filters.
+PARQUET_COPY_OPTIONS = "FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 3, ROW_GROUP_SIZE 131072"
+
+# Read-time dtypes for the loan workbook: low-cardinality text as pandas
+# categoricals (dictionary-encoded in Arrow/Parquet, VARCHAR in DuckDB) and
+# whole-number counts as nullable Int32. Only columns that are integral in the
+# source belong here (read_excel raises on fractional values); everything else
+# keeps the inferred dtype. Columns absent from a file are ignored.
+LOAN_DTYPES = {
+    'Loan Status': 'category',
+    'Term': 'category',
+    'Years in current job': 'category',
+    'Home Ownership': 'category',
+    'Purpose': 'category',
+    'Number of Open Accounts': 'Int32',
+    'Number of Credit Problems': 'Int32',
+}
+
+# SQL types of the RAW table columns, applied whichever reader parsed the
+# workbook: the types pandas infers for the loan data without LOAN_DTYPES,
+# which read_xlsx would otherwise infer as DOUBLE/VARCHAR. Other columns pass
+# through unchanged.
+RAW_COLUMN_TYPES = {
+    'Loan ID': 'VARCHAR',
+    'Customer ID': 'VARCHAR',
+    'Current Loan Amount': 'BIGINT',
+    'Credit Score': 'DOUBLE',
+    'Term': 'VARCHAR',
+    'Purpose': 'VARCHAR',
+    'Home Ownership': 'VARCHAR',
+    'Years in current job': 'VARCHAR',
+    'Loan Status': 'VARCHAR',
+    'Annual Income': 'DOUBLE',
+    'Monthly Debt': 'DOUBLE',
+    'Years of Credit History': 'DOUBLE',
+    'Months since last delinquent': 'DOUBLE',
+    'Number of Open Accounts': 'BIGINT',
+    'Number of Credit Problems': 'BIGINT',
+    'Current Credit Balance': 'BIGINT',
+    'Maximum Open Credit': 'DOUBLE',
+    'Bankruptcies': 'DOUBLE',
+    'Tax Liens': 'DOUBLE',
+}
+
+def safe_ident(name):
+    """Quote ``name`` as a SQL identifier (table names come from the CLI)"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def sql_literal(value):
+    """Quote ``value`` as a SQL string literal, for statements that take no parameters (COPY)"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def typed_select(con, source, params=None):
+    """SELECT list over ``source`` casting the known loan columns to RAW_COLUMN_TYPES"""
+    columns = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}", params).fetchall()]
+    return ", ".join(
+        f"CAST({safe_ident(column)} AS {RAW_COLUMN_TYPES[column]}) AS {safe_ident(column)}"
+        if column in RAW_COLUMN_TYPES else safe_ident(column)
+        for column in columns
+    )
+
+def _load_one(file_path, ingestion_ts):
+    """Read a single Excel file and attach the ingestion metadata columns.
+
+    Returns an Arrow table when PyArrow is available, so several files can be
+    combined without copying their buffers; otherwise a pandas DataFrame.
+    """
+    df = pd.read_excel(file_path, engine=EXCEL_ENGINE, dtype=LOAN_DTYPES)
+    if pa is None:
+        df['_source_file'] = file_path.name
+        df['_ingestion_timestamp'] = ingestion_ts
+        return df
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Constant metadata columns as single-run run-end-encoded arrays: O(1) storage,
+    # expanded by DuckDB only when scanned. Microsecond precision matches
+    # Parquet/DuckDB TIMESTAMP, so no ns->us cast on write.
+    run_ends = pa.array([table.num_rows], pa.int32())
+    table = table.append_column(
+        '_source_file',
+        pa.RunEndEncodedArray.from_arrays(run_ends, pa.array([file_path.name])),
+    )
+    return table.append_column(
+        '_ingestion_timestamp',
+        pa.RunEndEncodedArray.from_arrays(run_ends, pa.array([ingestion_ts], pa.timestamp('us'))),
+    )
+
+def resolve_excel_files(excel_path=None, excel_dir=None, excel_pattern=None):
+    """Return the Excel files to ingest (single file or directory listing)"""
     if excel_path:
         # Single file mode
         excel_path = Path(excel_path)
         if not excel_path.exists():
             raise FileNotFoundError(f"Excel file not found: {excel_path}")
-        print(f"📖 Loading single Excel file: {excel_path}")
-        df = pd.read_excel(excel_path)
-        df['_source_file'] = excel_path.name
-        df['_ingestion_timestamp'] = datetime.now()
-        dfs.append(df)
+        return [excel_path]
         
     elif excel_dir:
         # Directory mode (incremental) - more flexible
@@ -57,48 +158,130 @@ def load_excel_files(excel_path=None, excel_dir=None, excel_pattern=None):
         if excel_pattern:
             excel_files = list(excel_dir.glob(excel_pattern))
         else:
-            excel_files = list(excel_dir.glob("*.xlsx")) + list(excel_dir.glob("*.xls"))
+            # Single directory scan filtering by extension
+            with os.scandir(excel_dir) as entries:
+                excel_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and entry.name.endswith(('.xlsx', '.xls'))
+                ]
         
         if not excel_files:
             raise FileNotFoundError(f"No Excel files found in: {excel_dir} with pattern: {excel_pattern or '*.xlsx, *.xls'}")
-        
-        print(f"📖 Loading {len(excel_files)} Excel files from: {excel_dir}")
-        for file_path in excel_files:
-            print(f"  - Processing: {file_path.name}")
-            df = pd.read_excel(file_path)
-            df['_source_file'] = file_path.name
-            df['_ingestion_timestamp'] = datetime.now()
-            dfs.append(df)
+        return excel_files
     else:
         raise ValueError("Either --excel or --excel_dir must be specified")
+
+def file_fingerprint(file_path, with_hash=True):
+    """Build the raw._ingestion_log entry for a file (name, size, mtime and optionally SHA-256)"""
+    stat = file_path.stat()
+    sha256 = None
+    if with_hash:
+        with open(file_path, 'rb') as f:
+            sha256 = hashlib.file_digest(f, 'sha256').hexdigest()
+    return {
+        'source_file': file_path.name,
+        'sha256': sha256,
+        'file_size': stat.st_size,
+        'mtime': datetime.fromtimestamp(stat.st_mtime),
+    }
+
+def select_changed_files(con, excel_files, table_name):
+    """Return {path: log entry} for the files not yet ingested unchanged.
+
+    Files whose size and mtime match raw._ingestion_log are skipped with just
+    a stat(); the others are hashed and only skipped if the content is the same.
+    """
+    con.execute('CREATE SCHEMA IF NOT EXISTS raw;')
+    con.execute(INGESTION_LOG_DDL)
+    # The log is only meaningful while the RAW table it describes exists
+    logged = {
+        name: (sha256, file_size, mtime)
+        for name, sha256, file_size, mtime in con.execute("""
+            SELECT source_file, sha256, file_size, mtime FROM raw._ingestion_log
+            WHERE EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_schema = 'raw' AND table_name = ?
+            )
+        """, [table_name]).fetchall()
+    }
     
-    # Combine all DataFrames
-    if len(dfs) == 1:
-        return dfs[0]
-    else:
-        return pd.concat(dfs, ignore_index=True)
+    changed = {}
+    for file_path in excel_files:
+        entry = file_fingerprint(file_path, with_hash=False)
+        previous = logged.get(file_path.name)
+        if previous and previous[1:] == (entry['file_size'], entry['mtime']):
+            print(f"  - Skipping unchanged file: {file_path.name}")
+            continue
+        entry = file_fingerprint(file_path)
+        if previous and previous[0] == entry['sha256']:
+            print(f"  - Skipping unchanged file (same content): {file_path.name}")
+            continue
+        changed[file_path] = entry
+    return changed
 
-def write_parquet_with_metadata(df, raw_dir, table_name, mode):
-    """Write DataFrame to Parquet with metadata"""
-    raw_dir.mkdir(parents=True, exist_ok=True)
+def record_ingestion_log(con, file_log, source, mode):
+    """Upsert raw._ingestion_log entries for the files just loaded from ``source``"""
+    con.execute(INGESTION_LOG_DDL)
+    if mode == 'full_refresh':
+        # The RAW table was replaced, so previously logged files are gone
+        con.execute('DELETE FROM raw._ingestion_log;')
+    row_counts = dict(con.execute(f"SELECT _source_file, COUNT(*) FROM {source} GROUP BY _source_file").fetchall())
+    con.executemany(
+        """
+        INSERT OR REPLACE INTO raw._ingestion_log (source_file, sha256, file_size, mtime, row_count)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [
+            [e['source_file'], e['sha256'], e['file_size'], e['mtime'], row_counts.get(e['source_file'], 0)]
+            for e in file_log.values()
+        ],
+    )
+
+def load_excel_files(excel_files):
+    """Load Excel files and return the combined data (Arrow table, or DataFrame without PyArrow)"""
+    ingestion_ts = datetime.now()
     
-    # Generate filename with timestamp and mode
+    if len(excel_files) == 1:
+        print(f"📖 Loading single Excel file: {excel_files[0]}")
+        frames = [_load_one(excel_files[0], ingestion_ts)]
+    else:
+        print(f"📖 Loading {len(excel_files)} Excel files from: {excel_files[0].parent}")
+        for file_path in excel_files:
+            print(f"  - Processing: {file_path.name}")
+        
+        # Files are parsed concurrently; map() keeps the original file order
+        with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+            frames = list(executor.map(lambda f: _load_one(f, ingestion_ts), excel_files))
+    
+    # Combine all files (Arrow only chains the chunks, pandas copies them)
+    if len(frames) == 1:
+        return frames[0]
+    elif pa is None:
+        return pd.concat(frames, ignore_index=True)
+    else:
+        return pa.concat_tables(frames, promote_options="permissive")
+
+def raw_parquet_path(raw_dir, table_name, mode):
+    """Build a unique RAW Parquet path with timestamp and mode"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     parquet_filename = f"{table_name}_{mode}_{timestamp}_{uuid.uuid4().hex[:8]}.parquet"
-    parquet_path = raw_dir / parquet_filename
+    return raw_dir / parquet_filename
+
+def export_raw_parquet(con, source, raw_dir, table_name, mode):
+    """Archive a loaded batch as the RAW Parquet artifact using DuckDB's parallel writer"""
+    raw_dir.mkdir(parents=True, exist_ok=True)
     
-    if pq is None:
-        # Fallback using DuckDB to export Parquet
-        tmp_con = duckdb.connect(database=':memory:')
-        tmp_con.register('df_src', df)
-        tmp_con.execute(f"COPY (SELECT * FROM df_src) TO '{parquet_path.as_posix()}' (FORMAT PARQUET);")
-    else:
-        table = pa.Table.from_pandas(df)
-        pq.write_table(table, parquet_path)
+    parquet_path = raw_parquet_path(raw_dir, table_name, mode)
+    con.execute(f"COPY (SELECT {typed_select(con, source)} FROM {source}) TO {sql_literal(parquet_path.as_posix())} ({PARQUET_COPY_OPTIONS});")
     
     print(f"✅ RAW Parquet written: {parquet_path}")
     return parquet_path
 
+@functools.lru_cache(maxsize=1)
+def get_s3_client():
+    """S3 client shared across uploads (avoids repeated credential resolution)"""
+    return boto3.client('s3')
+
 def upload_to_s3(parquet_path, s3_bucket, s3_prefix):
     """Upload Parquet file to S3"""
     if boto3 is None:
@@ -106,70 +289,183 @@ def upload_to_s3(parquet_path, s3_bucket, s3_prefix):
     if not s3_bucket:
         raise ValueError('Missing --s3_bucket (or env RAW_S3_BUCKET) for --prod')
     
-    s3 = boto3.client('s3')
     s3_key = f"{s3_prefix.rstrip('/')}/{parquet_path.name}"
-    s3.upload_file(str(parquet_path), s3_bucket, s3_key)
+    # Multipart upload over parallel streams instead of a single TCP connection
+    transfer_config = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=16,
+        use_threads=True,
+    )
+    get_s3_client().upload_file(str(parquet_path), s3_bucket, s3_key, Config=transfer_config)
     print(f"✅ Uploaded to S3: s3://{s3_bucket}/{s3_key}")
 
-def load_to_duckdb(parquet_path, db_path, table_name, mode):
-    """Load Parquet data to DuckDB with mode-specific logic"""
-    con = duckdb.connect(database=str(db_path), read_only=False)
+def load_to_duckdb(con, source, table_name, mode, file_log=None):
+    """Load RAW data to DuckDB with mode-specific logic.
+
+    ``source`` is a relation registered on ``con`` (the in-memory Arrow table
+    or DataFrame), scanned in place by DuckDB. ``file_log`` entries are
+    recorded in raw._ingestion_log in the same transaction as the data.
+    """
     con.execute('CREATE SCHEMA IF NOT EXISTS raw;')
+    raw_table = f"raw.{safe_ident(table_name)}"
+    select_list = typed_select(con, source)
     
-    if mode == 'full_refresh':
-        # Drop and recreate table
-        con.execute(f'DROP TABLE IF EXISTS raw.{table_name};')
-        con.execute(f"CREATE TABLE raw.{table_name} AS SELECT * FROM read_parquet('{parquet_path.as_posix()}');")
-        print(f"✅ Full refresh: Recreated table raw.{table_name}")
+    # Single transaction for the whole load (also keeps full refresh atomic)
+    con.begin()
+    try:
+        if mode == 'full_refresh':
+            # Drop and recreate table
+            con.execute(f'DROP TABLE IF EXISTS {raw_table};')
+            con.execute(f"CREATE TABLE {raw_table} AS SELECT {select_list} FROM {source};")
+            print(f"✅ Full refresh: Recreated table raw.{table_name}")
+            
+        elif mode == 'incremental':
+            # Check if table exists
+            table_exists = con.execute("""
+                SELECT COUNT(*) FROM information_schema.tables 
+                WHERE table_schema = 'raw' AND table_name = ?
+            """, [table_name]).fetchone()[0] > 0
+            
+            if not table_exists:
+                # Create table if it doesn't exist
+                con.execute(f"CREATE TABLE {raw_table} AS SELECT {select_list} FROM {source};")
+                print(f"✅ Incremental: Created new table raw.{table_name}")
+            else:
+                # Append to existing table (BY NAME tolerates column-order drift between Excel versions)
+                con.execute(f"""
+                    INSERT INTO {raw_table} BY NAME
+                    SELECT {select_list} FROM {source}
+                """)
+                print(f"✅ Incremental: Appended to existing table raw.{table_name}")
         
-    elif mode == 'incremental':
-        # Check if table exists
-        table_exists = con.execute(f"""
-            SELECT COUNT(*) FROM information_schema.tables 
-            WHERE table_schema = 'raw' AND table_name = '{table_name}'
-        """).fetchone()[0] > 0
-        
-        if not table_exists:
-            # Create table if it doesn't exist
-            con.execute(f"CREATE TABLE raw.{table_name} AS SELECT * FROM read_parquet('{parquet_path.as_posix()}');")
-            print(f"✅ Incremental: Created new table raw.{table_name}")
-        else:
-            # Append to existing table
-            con.execute(f"""
-                INSERT INTO raw.{table_name} 
-                SELECT * FROM read_parquet('{parquet_path.as_posix()}')
-            """)
-            print(f"✅ Incremental: Appended to existing table raw.{table_name}")
+        if file_log:
+            record_ingestion_log(con, file_log, source, mode)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
     
     # Get final count
-    count = con.execute(f"SELECT COUNT(*) FROM raw.{table_name}").fetchone()[0]
+    count = con.execute(f"SELECT COUNT(*) FROM {raw_table}").fetchone()[0]
     print(f"   Total records in raw.{table_name}: {count:,}")
+
+def ingest_excel_with_duckdb(con, excel_path, raw_dir, table_name, file_log=None):
+    """Full refresh of a single Excel file using DuckDB's native read_xlsx.
+
+    Skips pandas/PyArrow entirely: DuckDB parses the workbook into the RAW
+    table, then exports that table as the RAW Parquet artifact. Returns the
+    Parquet path, or None if the excel extension is unavailable or cannot
+    open the file (callers then fall back to the pandas path). Errors after
+    that point are raised, not retried through pandas.
+    """
+    try:
+        con.execute('INSTALL excel; LOAD excel;')
+        # Probe: resolving the workbook's columns fails if read_xlsx can't read it
+        select_list = typed_select(con, "read_xlsx(?)", [excel_path.as_posix()])
+    except duckdb.Error as e:
+        print(f"⚠️  DuckDB read_xlsx unavailable ({e}), falling back to pandas")
+        return None
     
-    con.close()
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path = raw_parquet_path(raw_dir, table_name, 'full_refresh')
+    raw_table = f"raw.{safe_ident(table_name)}"
+    
+    print(f"📖 Loading single Excel file with DuckDB read_xlsx: {excel_path}")
+    con.execute('CREATE SCHEMA IF NOT EXISTS raw;')
+    # Table and ingestion log in one transaction, as in load_to_duckdb
+    con.begin()
+    try:
+        con.execute(f"""
+            CREATE OR REPLACE TABLE {raw_table} AS
+            SELECT {select_list},
+                   ? AS _source_file,
+                   localtimestamp AS _ingestion_timestamp
+            FROM read_xlsx(?)
+        """, [excel_path.name, excel_path.as_posix()])
+        if file_log:
+            record_ingestion_log(con, file_log, raw_table, 'full_refresh')
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    print(f"✅ Full refresh: Recreated table raw.{table_name}")
+    
+    con.execute(f"COPY {raw_table} TO {sql_literal(parquet_path.as_posix())} ({PARQUET_COPY_OPTIONS});")
+    print(f"✅ RAW Parquet written: {parquet_path}")
+    
+    count = con.execute(f"SELECT COUNT(*) FROM {raw_table}").fetchone()[0]
+    print(f"   Total records in raw.{table_name}: {count:,}")
+    
+    return parquet_path
+
+def main(args, con=None):
+    """Run the ingestion for the given parsed arguments.
+
+    An open connection to ``args.duckdb`` can be passed in (e.g. the Airflow
+    worker's shared connection); otherwise one is opened and closed here.
+    """
+    if con is not None:
+        return ingest(args, con)
+    
+    con = duckdb.connect(database=str(args.duckdb), read_only=False)
+    con.execute(f"PRAGMA threads={os.cpu_count()}")
+    con.execute("PRAGMA disable_progress_bar")
+    try:
+        ingest(args, con)
+    finally:
+        con.close()
+
+def ingest(args, con):
+    """Ingest the Excel source(s) described by ``args`` through connection ``con``"""
+    db_path = Path(args.duckdb)
+    raw_dir = Path(args.raw_dir)
+    table_name = args.table
 
-# Main execution
-db_path = Path(args.duckdb)
-raw_dir = Path(args.raw_dir)
-table_name = args.table
+    print(f"🚀 Starting {args.mode} ingestion")
+    print(f"   Mode: {args.mode}")
+    print(f"   Table: raw.{table_name}")
+    print(f"   Database: {db_path}")
 
-print(f"🚀 Starting {args.mode} ingestion")
-print(f"   Mode: {args.mode}")
-print(f"   Table: raw.{table_name}")
-print(f"   Database: {db_path}")
+    excel_files = resolve_excel_files(args.excel, args.excel_dir, args.excel_pattern)
+    if args.mode == 'incremental':
+        # Only parse files that are new or changed since the last ingestion
+        file_log = select_changed_files(con, excel_files, table_name)
+        if not file_log:
+            print("✅ No new or changed Excel files, nothing to ingest")
+            return
+        excel_files = list(file_log)
+    else:
+        file_log = {file_path: file_fingerprint(file_path) for file_path in excel_files}
 
-# 1) Load Excel files
-df = load_excel_files(args.excel, args.excel_dir, args.excel_pattern)
-print(f"   Loaded {len(df):,} records from Excel")
+    # Fast path: a single-file full refresh is handled entirely inside DuckDB
+    if args.mode == 'full_refresh' and args.excel:
+        parquet_path = ingest_excel_with_duckdb(con, excel_files[0], raw_dir, table_name, file_log)
+        if parquet_path is not None:
+            if args.prod:
+                upload_to_s3(parquet_path, args.s3_bucket, args.s3_prefix)
+            print("✅ Ingestion completed successfully")
+            return
 
-# 2) Write RAW data to Parquet
-parquet_path = write_parquet_with_metadata(df, raw_dir, table_name, args.mode)
+    # 1) Load Excel files
+    data = load_excel_files(excel_files)
+    print(f"   Loaded {len(data):,} records from Excel")
 
-# 3) Upload to S3 (if production mode)
-if args.prod:
-    upload_to_s3(parquet_path, args.s3_bucket, args.s3_prefix)
+    # 2) Load to DuckDB straight from memory, then 3) archive the same batch as
+    # RAW Parquet (no write-then-read-back of the file)
+    con.register('src', data)
+    try:
+        load_to_duckdb(con, 'src', table_name, args.mode, file_log)
+        parquet_path = export_raw_parquet(con, 'src', raw_dir, table_name, args.mode)
+    finally:
+        con.unregister('src')  # don't pin the batch on a long-lived connection
+    del data
 
-# 4) Load to DuckDB
-load_to_duckdb(parquet_path, db_path, table_name, args.mode)
+    # 4) Upload to S3 (if production mode)
+    if args.prod:
+        upload_to_s3(parquet_path, args.s3_bucket, args.s3_prefix)
 
-print("✅ Ingestion completed successfully")
+    print("✅ Ingestion completed successfully")
 
+if __name__ == "__main__":
+    main(parser.parse_args())
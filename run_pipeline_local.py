@@ -14,8 +14,7 @@ sys.path.append(str(Path(__file__).parent / "airflow" / "utils"))
 from pipeline_functions import (
     run_ingestion,
     run_dbt_deps,
-    run_dbt_models,
-    run_dbt_tests,
+    run_dbt_build,
     generate_dbt_docs,
     validate_data_quality,
     get_project_paths
@@ -35,20 +34,16 @@ def run_pipeline():
         print("\n📦 Step 2: Installing dbt dependencies...")
         run_dbt_deps()
         
-        # Step 3: dbt run
-        print("\n🔄 Step 3: Running dbt models (SILVER & GOLD)...")
-        run_dbt_models()
+        # Step 3: dbt build (models + tests)
+        print("\n🔄 Step 3: Running dbt build (SILVER & GOLD models + tests)...")
+        run_dbt_build()
         
-        # Step 4: dbt tests
-        print("\n🧪 Step 4: Running dbt tests...")
-        run_dbt_tests()
-        
-        # Step 5: Data quality validation
-        print("\n✅ Step 5: Additional data quality checks...")
+        # Step 4: Data quality validation
+        print("\n✅ Step 4: Additional data quality checks...")
         validate_data_quality()
         
-        # Step 6: Generate docs
-        print("\n📚 Step 6: Generating dbt documentation...")
+        # Step 5: Generate docs
+        print("\n📚 Step 5: Generating dbt documentation...")
         generate_dbt_docs()
         
         print("\n" + "=" * 50)
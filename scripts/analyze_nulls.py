@@ -3,171 +3,304 @@
 NULL Analysis Script - Detailed Meaning Analysis
 """
 
-import duckdb
+from contextlib import closing
+from duckdb_utils import connect
 import pandas as pd
 from pathlib import Path
+from types import MappingProxyType
+
+# NULL meaning metadata per column (read-only, built once at import)
+_RAW_COLUMN_META = MappingProxyType({
+    'Loan ID': {
+        'meaning': 'ERROR: Should not have NULLs - Unique identifier required',
+        'impact': 'CRITICAL - Invalid record',
+        'action': 'Review data source'
+    },
+    'Customer ID': {
+        'meaning': 'ERROR: Should not have NULLs - Customer must be identified',
+        'impact': 'CRITICAL - Invalid record',
+        'action': 'Review data source'
+    },
+    'Loan Status': {
+        'meaning': 'ERROR: Loan status is mandatory',
+        'impact': 'CRITICAL - Cannot process',
+        'action': 'Review data source'
+    },
+    'Term': {
+        'meaning': 'Missing data - Loan term not specified',
+        'impact': 'HIGH - Affects risk analysis',
+        'action': 'Request complete data'
+    },
+    'Credit Score': {
+        'meaning': 'No credit history or insufficient data',
+        'impact': 'HIGH - Cannot assess credit risk',
+        'action': 'Find alternative data sources'
+    },
+    'Current Loan Amount': {
+        'meaning': 'No active loans or amount not reported',
+        'impact': 'MEDIUM - Affects exposure analysis',
+        'action': 'Verify if 0 or truly NULL'
+    },
+    'Annual Income': {
+        'meaning': 'Unemployed or income not reported',
+        'impact': 'HIGH - Cannot assess repayment capacity',
+        'action': 'Request employment information'
+    },
+    'Monthly Debt': {
+        'meaning': 'No monthly debt obligations',
+        'impact': 'LOW - Positive for analysis',
+        'action': 'Confirm if 0 or NULL'
+    },
+    'Years of Credit History': {
+        'meaning': 'No established credit history',
+        'impact': 'HIGH - New customer or no credit',
+        'action': 'Evaluate as new customer'
+    },
+    'Months since last delinquent': {
+        'meaning': 'NO DELINQUENCY - Clean history (POSITIVE)',
+        'impact': 'POSITIVE - Good payment behavior',
+        'action': 'Mark as good payer'
+    },
+    'Number of Open Accounts': {
+        'meaning': 'No open accounts or data not available',
+        'impact': 'MEDIUM - Affects credit diversification',
+        'action': 'Verify if 0 or NULL'
+    },
+    'Number of Credit Problems': {
+        'meaning': 'NO CREDIT PROBLEMS (POSITIVE)',
+        'impact': 'POSITIVE - Good history',
+        'action': 'Mark as good payer'
+    },
+    'Current Credit Balance': {
+        'meaning': 'No current credit balance',
+        'impact': 'LOW - No credit exposure',
+        'action': 'Verify if 0 or NULL'
+    },
+    'Maximum Open Credit': {
+        'meaning': 'No maximum credit line established',
+        'impact': 'MEDIUM - Cannot assess capacity',
+        'action': 'Request credit limit information'
+    },
+    'Bankruptcies': {
+        'meaning': 'NO BANKRUPTCIES (POSITIVE)',
+        'impact': 'POSITIVE - Good financial history',
+        'action': 'Mark as good risk'
+    },
+    'Tax Liens': {
+        'meaning': 'NO TAX LIENS (POSITIVE)',
+        'impact': 'POSITIVE - Clean tax situation',
+        'action': 'Mark as good payer'
+    },
+    'Purpose': {
+        'meaning': 'Loan purpose not specified',
+        'impact': 'MEDIUM - Affects purpose-based risk analysis',
+        'action': 'Request purpose information'
+    },
+    'Job Tenure Years': {
+        'meaning': 'Unemployed or tenure not reported',
+        'impact': 'HIGH - Cannot assess employment stability',
+        'action': 'Request employment information'
+    },
+    'Home Ownership': {
+        'meaning': 'Home ownership status unknown',
+        'impact': 'MEDIUM - Affects stability analysis',
+        'action': 'Request property information'
+    }
+})
+
+_SILVER_COLUMN_META = MappingProxyType({
+    'loan_id': {
+        'meaning': 'ERROR: Should not have NULLs after cleaning',
+        'impact': 'CRITICAL - Invalid record',
+        'action': 'Review cleaning process'
+    },
+    'customer_id': {
+        'meaning': 'ERROR: Customer must be identified',
+        'impact': 'CRITICAL - Invalid record',
+        'action': 'Review cleaning process'
+    },
+    'loan_status': {
+        'meaning': 'ERROR: Loan status is mandatory',
+        'impact': 'CRITICAL - Cannot process',
+        'action': 'Review cleaning process'
+    },
+    'term': {
+        'meaning': 'Missing data - Term not specified',
+        'impact': 'HIGH - Affects risk analysis',
+        'action': 'Request complete data'
+    },
+    'credit_score': {
+        'meaning': 'No credit history or insufficient data',
+        'impact': 'HIGH - Cannot assess credit risk',
+        'action': 'Find alternative data sources'
+    },
+    'current_loan_amount': {
+        'meaning': 'No active loans or amount not reported',
+        'impact': 'MEDIUM - Affects exposure analysis',
+        'action': 'Verify if 0 or truly NULL'
+    },
+    'annual_income': {
+        'meaning': 'Unemployed or income not reported',
+        'impact': 'HIGH - Cannot assess repayment capacity',
+        'action': 'Request employment information'
+    },
+    'monthly_debt': {
+        'meaning': 'No monthly debt obligations',
+        'impact': 'LOW - Positive for analysis',
+        'action': 'Confirm if 0 or NULL'
+    },
+    'years_credit_history': {
+        'meaning': 'No established credit history',
+        'impact': 'HIGH - New customer or no credit',
+        'action': 'Evaluate as new customer'
+    },
+    'months_since_last_delinquent': {
+        'meaning': 'NO DELINQUENCY - Clean history (POSITIVE)',
+        'impact': 'POSITIVE - Good payment behavior',
+        'action': 'Mark as good payer'
+    },
+    'n_open_accounts': {
+        'meaning': 'No open accounts or data not available',
+        'impact': 'MEDIUM - Affects credit diversification',
+        'action': 'Verify if 0 or NULL'
+    },
+    'n_credit_problems': {
+        'meaning': 'NO CREDIT PROBLEMS (POSITIVE)',
+        'impact': 'POSITIVE - Good history',
+        'action': 'Mark as good payer'
+    },
+    'current_credit_balance': {
+        'meaning': 'No current credit balance',
+        'impact': 'LOW - No credit exposure',
+        'action': 'Verify if 0 or NULL'
+    },
+    'max_open_credit': {
+        'meaning': 'No maximum credit line established',
+        'impact': 'MEDIUM - Cannot assess capacity',
+        'action': 'Request credit limit information'
+    },
+    'bankruptcies': {
+        'meaning': 'NO BANKRUPTCIES (POSITIVE)',
+        'impact': 'POSITIVE - Good financial history',
+        'action': 'Mark as good risk'
+    },
+    'tax_liens': {
+        'meaning': 'NO TAX LIENS (POSITIVE)',
+        'impact': 'POSITIVE - Clean tax situation',
+        'action': 'Mark as good payer'
+    },
+    'purpose_name': {
+        'meaning': 'Loan purpose not specified',
+        'impact': 'MEDIUM - Affects purpose-based risk analysis',
+        'action': 'Request purpose information'
+    },
+    'job_tenure_years': {
+        'meaning': 'Unemployed or tenure not reported',
+        'impact': 'HIGH - Cannot assess employment stability',
+        'action': 'Request employment information'
+    },
+    'home_ownership': {
+        'meaning': 'Home ownership status unknown',
+        'impact': 'MEDIUM - Affects stability analysis',
+        'action': 'Request property information'
+    }
+})
+
+def _null_sql_fragments(columns, quote):
+    """Per-column "NULL count, NULL %" SELECT fragment for the fused NULL query"""
+    fragments = {}
+    for column in columns:
+        ident = f'"{column}"' if quote else column
+        fragments[column] = (
+            f"COUNT(*) FILTER (WHERE {ident} IS NULL), "
+            f"ROUND(COUNT(*) FILTER (WHERE {ident} IS NULL) * 100.0 / COUNT(*), 2)"
+        )
+    return MappingProxyType(fragments)
+
+# SELECT fragments built once at import (RAW names need quoting, SILVER ones don't)
+_RAW_NULL_SQL = _null_sql_fragments(_RAW_COLUMN_META, quote=True)
+_SILVER_NULL_SQL = _null_sql_fragments(_SILVER_COLUMN_META, quote=False)
 
 def analyze_null_meanings():
     """Analyze what each NULL means in each column"""
     
     try:
-        con = duckdb.connect('data_challenge.duckdb')
+        con = connect('data_challenge.duckdb')
         print("✅ Connected to database successfully!")
     except Exception as e:
         print(f"❌ Error connecting to database: {e}")
         print("💡 Make sure DBeaver is not connected to the database")
         return
     
-    print("\n🔍 DETAILED NULL MEANING ANALYSIS")
-    print("=" * 70)
-    
-    # Analyze each column in raw.raw_loans
-    print("\n📊 RAW.RAW_LOANS - NULL meaning by column:")
-    print("=" * 70)
-    
-    raw_analysis = analyze_raw_nulls(con)
-    
-    # Analyze each column in silver.silver_loans
-    print("\n📊 MAIN_SILVER.SILVER_LOANS - NULL meaning by column:")
-    print("=" * 70)
-    
-    silver_analysis = analyze_silver_nulls(con)
-    
-    con.close()
+    # Always release the file handle, even if a query fails
+    with closing(con):
+        print("\n🔍 DETAILED NULL MEANING ANALYSIS")
+        print("=" * 70)
+        
+        # Analyze each column in raw.raw_loans
+        print("\n📊 RAW.RAW_LOANS - NULL meaning by column:")
+        print("=" * 70)
+        
+        raw_analysis = analyze_raw_nulls(con)
+        
+        # Analyze each column in silver.silver_loans
+        print("\n📊 MAIN_SILVER.SILVER_LOANS - NULL meaning by column:")
+        print("=" * 70)
+        
+        silver_analysis = analyze_silver_nulls(con)
     
     # Generar documentación detallada
     generate_detailed_null_documentation(raw_analysis, silver_analysis)
 
-def analyze_raw_nulls(con):
-    """Analyze NULLs in raw layer with detailed meaning"""
+def collect_null_results(con, schema, table, columns_analysis, null_sql):
+    """Count NULLs for every analysed column in a single scan of the table"""
     
-    columns_analysis = {
-        'Loan ID': {
-            'meaning': 'ERROR: Should not have NULLs - Unique identifier required',
-            'impact': 'CRITICAL - Invalid record',
-            'action': 'Review data source'
-        },
-        'Customer ID': {
-            'meaning': 'ERROR: Should not have NULLs - Customer must be identified',
-            'impact': 'CRITICAL - Invalid record',
-            'action': 'Review data source'
-        },
-        'Loan Status': {
-            'meaning': 'ERROR: Loan status is mandatory',
-            'impact': 'CRITICAL - Cannot process',
-            'action': 'Review data source'
-        },
-        'Term': {
-            'meaning': 'Missing data - Loan term not specified',
-            'impact': 'HIGH - Affects risk analysis',
-            'action': 'Request complete data'
-        },
-        'Credit Score': {
-            'meaning': 'No credit history or insufficient data',
-            'impact': 'HIGH - Cannot assess credit risk',
-            'action': 'Find alternative data sources'
-        },
-        'Current Loan Amount': {
-            'meaning': 'No active loans or amount not reported',
-            'impact': 'MEDIUM - Affects exposure analysis',
-            'action': 'Verify if 0 or truly NULL'
-        },
-        'Annual Income': {
-            'meaning': 'Unemployed or income not reported',
-            'impact': 'HIGH - Cannot assess repayment capacity',
-            'action': 'Request employment information'
-        },
-        'Monthly Debt': {
-            'meaning': 'No monthly debt obligations',
-            'impact': 'LOW - Positive for analysis',
-            'action': 'Confirm if 0 or NULL'
-        },
-        'Years of Credit History': {
-            'meaning': 'No established credit history',
-            'impact': 'HIGH - New customer or no credit',
-            'action': 'Evaluate as new customer'
-        },
-        'Months since last delinquent': {
-            'meaning': 'NO DELINQUENCY - Clean history (POSITIVE)',
-            'impact': 'POSITIVE - Good payment behavior',
-            'action': 'Mark as good payer'
-        },
-        'Number of Open Accounts': {
-            'meaning': 'No open accounts or data not available',
-            'impact': 'MEDIUM - Affects credit diversification',
-            'action': 'Verify if 0 or NULL'
-        },
-        'Number of Credit Problems': {
-            'meaning': 'NO CREDIT PROBLEMS (POSITIVE)',
-            'impact': 'POSITIVE - Good history',
-            'action': 'Mark as good payer'
-        },
-        'Current Credit Balance': {
-            'meaning': 'No current credit balance',
-            'impact': 'LOW - No credit exposure',
-            'action': 'Verify if 0 or NULL'
-        },
-        'Maximum Open Credit': {
-            'meaning': 'No maximum credit line established',
-            'impact': 'MEDIUM - Cannot assess capacity',
-            'action': 'Request credit limit information'
-        },
-        'Bankruptcies': {
-            'meaning': 'NO BANKRUPTCIES (POSITIVE)',
-            'impact': 'POSITIVE - Good financial history',
-            'action': 'Mark as good risk'
-        },
-        'Tax Liens': {
-            'meaning': 'NO TAX LIENS (POSITIVE)',
-            'impact': 'POSITIVE - Clean tax situation',
-            'action': 'Mark as good payer'
-        },
-        'Purpose': {
-            'meaning': 'Loan purpose not specified',
-            'impact': 'MEDIUM - Affects purpose-based risk analysis',
-            'action': 'Request purpose information'
-        },
-        'Job Tenure Years': {
-            'meaning': 'Unemployed or tenure not reported',
-            'impact': 'HIGH - Cannot assess employment stability',
-            'action': 'Request employment information'
-        },
-        'Home Ownership': {
-            'meaning': 'Home ownership status unknown',
-            'impact': 'MEDIUM - Affects stability analysis',
-            'action': 'Request property information'
-        }
+    # Only columns that exist in the table (e.g. 'Job Tenure Years' is derived in SILVER)
+    existing = {
+        row[0] for row in con.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_schema = ? AND table_name = ?",
+            [schema, table]
+        ).fetchall()
     }
+    columns = [c for c in columns_analysis if c in existing]
     
-    results = []
+    # One COUNT(*) FILTER pair per column, all computed in the same pass
+    exprs = ", ".join(null_sql[column] for column in columns)
+    row = con.execute(f"SELECT COUNT(*), {exprs} FROM {schema}.{table}").fetchone()
     
-    for column, analysis in columns_analysis.items():
-        # Contar NULLs
-        result = con.execute(f'''
-            SELECT 
-                COUNT(*) as total_rows,
-                COUNT(*) FILTER (WHERE "{column}" IS NULL) as null_count,
-                ROUND(COUNT(*) FILTER (WHERE "{column}" IS NULL) * 100.0 / COUNT(*), 2) as null_percentage
-            FROM raw.raw_loans
-        ''').fetchone()
-        
-        if result[1] > 0:  # Si hay NULLs
+    results = []
+    total_rows = row[0]
+    for i, column in enumerate(columns):
+        null_count, null_percentage = row[1 + 2 * i], row[2 + 2 * i]
+        if null_count > 0:  # Si hay NULLs
+            analysis = columns_analysis[column]
             results.append({
                 'column': column,
-                'total_rows': result[0],
-                'null_count': result[1],
-                'null_percentage': result[2],
+                'total_rows': total_rows,
+                'null_count': null_count,
+                'null_percentage': null_percentage,
                 'meaning': analysis['meaning'],
                 'impact': analysis['impact'],
                 'action': analysis['action']
             })
+    return results
+
+def analyze_raw_nulls(con):
+    """Analyze NULLs in raw layer with detailed meaning"""
+    
+    results = collect_null_results(con, 'raw', 'raw_loans', _RAW_COLUMN_META, _RAW_NULL_SQL)
     
     # Show results
     if results:
-        print("\n| Column | Total | NULLs | % | Meaning | Impact | Action |")
-        print("|--------|-------|-------|---|---------|--------|--------|")
-        for r in results:
-            print(f"| {r['column']} | {r['total_rows']:,} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |")
+        lines = [
+            "\n| Column | Total | NULLs | % | Meaning | Impact | Action |",
+            "|--------|-------|-------|---|---------|--------|--------|",
+        ]
+        lines.extend(
+            f"| {r['column']} | {r['total_rows']:,} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |"
+            for r in results
+        )
+        print("\n".join(lines))
     else:
         print("✅ No NULLs found in RAW layer")
     
@@ -176,142 +309,42 @@ def analyze_raw_nulls(con):
 def analyze_silver_nulls(con):
     """Analyze NULLs in silver layer with detailed meaning"""
     
-    columns_analysis = {
-        'loan_id': {
-            'meaning': 'ERROR: Should not have NULLs after cleaning',
-            'impact': 'CRITICAL - Invalid record',
-            'action': 'Review cleaning process'
-        },
-        'customer_id': {
-            'meaning': 'ERROR: Customer must be identified',
-            'impact': 'CRITICAL - Invalid record',
-            'action': 'Review cleaning process'
-        },
-        'loan_status': {
-            'meaning': 'ERROR: Loan status is mandatory',
-            'impact': 'CRITICAL - Cannot process',
-            'action': 'Review cleaning process'
-        },
-        'term': {
-            'meaning': 'Missing data - Term not specified',
-            'impact': 'HIGH - Affects risk analysis',
-            'action': 'Request complete data'
-        },
-        'credit_score': {
-            'meaning': 'No credit history or insufficient data',
-            'impact': 'HIGH - Cannot assess credit risk',
-            'action': 'Find alternative data sources'
-        },
-        'current_loan_amount': {
-            'meaning': 'No active loans or amount not reported',
-            'impact': 'MEDIUM - Affects exposure analysis',
-            'action': 'Verify if 0 or truly NULL'
-        },
-        'annual_income': {
-            'meaning': 'Unemployed or income not reported',
-            'impact': 'HIGH - Cannot assess repayment capacity',
-            'action': 'Request employment information'
-        },
-        'monthly_debt': {
-            'meaning': 'No monthly debt obligations',
-            'impact': 'LOW - Positive for analysis',
-            'action': 'Confirm if 0 or NULL'
-        },
-        'years_credit_history': {
-            'meaning': 'No established credit history',
-            'impact': 'HIGH - New customer or no credit',
-            'action': 'Evaluate as new customer'
-        },
-        'months_since_last_delinquent': {
-            'meaning': 'NO DELINQUENCY - Clean history (POSITIVE)',
-            'impact': 'POSITIVE - Good payment behavior',
-            'action': 'Mark as good payer'
-        },
-        'n_open_accounts': {
-            'meaning': 'No open accounts or data not available',
-            'impact': 'MEDIUM - Affects credit diversification',
-            'action': 'Verify if 0 or NULL'
-        },
-        'n_credit_problems': {
-            'meaning': 'NO CREDIT PROBLEMS (POSITIVE)',
-            'impact': 'POSITIVE - Good history',
-            'action': 'Mark as good payer'
-        },
-        'current_credit_balance': {
-            'meaning': 'No current credit balance',
-            'impact': 'LOW - No credit exposure',
-            'action': 'Verify if 0 or NULL'
-        },
-        'max_open_credit': {
-            'meaning': 'No maximum credit line established',
-            'impact': 'MEDIUM - Cannot assess capacity',
-            'action': 'Request credit limit information'
-        },
-        'bankruptcies': {
-            'meaning': 'NO BANKRUPTCIES (POSITIVE)',
-            'impact': 'POSITIVE - Good financial history',
-            'action': 'Mark as good risk'
-        },
-        'tax_liens': {
-            'meaning': 'NO TAX LIENS (POSITIVE)',
-            'impact': 'POSITIVE - Clean tax situation',
-            'action': 'Mark as good payer'
-        },
-        'purpose_name': {
-            'meaning': 'Loan purpose not specified',
-            'impact': 'MEDIUM - Affects purpose-based risk analysis',
-            'action': 'Request purpose information'
-        },
-        'job_tenure_years': {
-            'meaning': 'Unemployed or tenure not reported',
-            'impact': 'HIGH - Cannot assess employment stability',
-            'action': 'Request employment information'
-        },
-        'home_ownership': {
-            'meaning': 'Home ownership status unknown',
-            'impact': 'MEDIUM - Affects stability analysis',
-            'action': 'Request property information'
-        }
-    }
-    
-    results = []
-    
-    for column, analysis in columns_analysis.items():
-        # Contar NULLs
-        result = con.execute(f'''
-            SELECT 
-                COUNT(*) as total_rows,
-                COUNT(*) FILTER (WHERE {column} IS NULL) as null_count,
-                ROUND(COUNT(*) FILTER (WHERE {column} IS NULL) * 100.0 / COUNT(*), 2) as null_percentage
-            FROM main_silver.silver_loans
-        ''').fetchone()
-        
-        if result[1] > 0:  # Si hay NULLs
-            results.append({
-                'column': column,
-                'total_rows': result[0],
-                'null_count': result[1],
-                'null_percentage': result[2],
-                'meaning': analysis['meaning'],
-                'impact': analysis['impact'],
-                'action': analysis['action']
-            })
+    results = collect_null_results(con, 'main_silver', 'silver_loans', _SILVER_COLUMN_META, _SILVER_NULL_SQL)
     
     # Show results
     if results:
-        print("\n| Column | Total | NULLs | % | Meaning | Impact | Action |")
-        print("|--------|-------|-------|---|---------|--------|--------|")
-        for r in results:
-            print(f"| {r['column']} | {r['total_rows']:,} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |")
+        lines = [
+            "\n| Column | Total | NULLs | % | Meaning | Impact | Action |",
+            "|--------|-------|-------|---|---------|--------|--------|",
+        ]
+        lines.extend(
+            f"| {r['column']} | {r['total_rows']:,} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |"
+            for r in results
+        )
+        print("\n".join(lines))
     else:
         print("✅ No NULLs found in SILVER layer")
     
     return results
 
-def generate_detailed_null_documentation(raw_analysis, silver_analysis):
-    """Generate detailed documentation about NULL meanings"""
-    
-    docs_content = """# NULL Values - Detailed Meaning Analysis
+_MARKDOWN_TABLE_HEADER = """
+| Column | NULL Count | NULL % | Meaning | Impact | Action |
+|--------|------------|--------|---------|--------|--------|
+"""
+
+def _markdown_row(r):
+    """Render one result dict as a Markdown table row"""
+    return f"| {r['column']} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |\n"
+
+def _write_layer_table(f, analysis, layer):
+    """Write one layer's NULL table (a list of result dicts) to ``f``"""
+    if not analysis:
+        f.write(f"✅ **No NULL values found in {layer} layer**\n")
+        return
+    f.write(_MARKDOWN_TABLE_HEADER)
+    f.writelines(_markdown_row(r) for r in analysis)
+
+_DOC_HEADER = """# NULL Values - Detailed Meaning Analysis
 
 ## Overview
 This document provides a detailed analysis of what each NULL value means in each column of our loan data pipeline.
@@ -347,33 +380,13 @@ This document provides a detailed analysis of what each NULL value means in each
 
 ### RAW Layer Analysis
 """
-    
-    if raw_analysis:
-        docs_content += """
-| Column | NULL Count | NULL % | Meaning | Impact | Action |
-|--------|------------|--------|---------|--------|--------|
-"""
-        for r in raw_analysis:
-            docs_content += f"| {r['column']} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |\n"
-    else:
-        docs_content += "✅ **No NULL values found in RAW layer**\n"
-    
-    docs_content += """
+
+_DOC_SILVER_HEADING = """
 
 ### SILVER Layer Analysis
 """
-    
-    if silver_analysis:
-        docs_content += """
-| Column | NULL Count | NULL % | Meaning | Impact | Action |
-|--------|------------|--------|---------|--------|--------|
-"""
-        for r in silver_analysis:
-            docs_content += f"| {r['column']} | {r['null_count']:,} | {r['null_percentage']}% | {r['meaning']} | {r['impact']} | {r['action']} |\n"
-    else:
-        docs_content += "✅ **No NULL values found in SILVER layer**\n"
-    
-    docs_content += """
+
+_DOC_FOOTER = """
 
 ## Business Rules for NULL Handling
 
@@ -543,11 +556,18 @@ END as risk_category
 ---
 *This document should be updated whenever NULL patterns change or new business rules are implemented.*
 """
+
+def generate_detailed_null_documentation(raw_analysis, silver_analysis):
+    """Generate detailed documentation about NULL meanings"""
     
     # Guardar documentación
     docs_path = Path(__file__).parent.parent / "docs" / "NULL_MEANING_ANALYSIS.md"
-    with open(docs_path, 'w', encoding='utf-8') as f:
-        f.write(docs_content)
+    with docs_path.open('w', encoding='utf-8') as f:
+        f.write(_DOC_HEADER)
+        _write_layer_table(f, raw_analysis, 'RAW')
+        f.write(_DOC_SILVER_HEADING)
+        _write_layer_table(f, silver_analysis, 'SILVER')
+        f.write(_DOC_FOOTER)
     
     print(f"\n📄 Detailed documentation generated: {docs_path}")
     print("✅ Complete NULL meaning analysis completed")
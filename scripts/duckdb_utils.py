@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+DuckDB connection helper shared by the analysis scripts.
+"""
+
+import os
+import duckdb
+
+def connect(db_path, read_only=True):
+    """Open a DuckDB database, applying DUCKDB_MEMORY_LIMIT when it is set
+
+    Threads and memory otherwise keep DuckDB's defaults (all cores, 80% of RAM).
+    """
+    con = duckdb.connect(str(db_path), read_only=read_only)
+    memory_limit = os.getenv('DUCKDB_MEMORY_LIMIT')
+    if memory_limit:
+        con.execute("SET memory_limit = ?", [memory_limit])
+    return con
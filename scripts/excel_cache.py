@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Parquet cache for the raw Excel files used by the analysis scripts.
+The workbook is parsed once and the scripts query the Parquet copy with DuckDB.
+"""
+
+import sys
+import duckdb
+import pandas as pd
+import pyarrow as pa
+from pathlib import Path
+
+# Make the ingest package importable when run as `python scripts/<script>.py`
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(_PROJECT_ROOT))
+
+from ingest.ingest_excel_to_duckdb import sql_literal
+
+# Outside data/, which incremental ingestion scans as its --excel_dir
+CACHE_DIR = _PROJECT_ROOT / "raw_data" / "cache"
+
+def ensure_parquet(con, excel_file, parquet_file=None):
+    """Return the Parquet copy of an Excel file, converting it if missing or stale
+
+    The copy is CACHE_DIR/<workbook name>.parquet unless a path is given.
+    """
+    excel_file = Path(excel_file)
+    parquet_file = Path(parquet_file) if parquet_file else CACHE_DIR / f"{excel_file.stem}.parquet"
+    parquet_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if parquet_file.exists() and parquet_file.stat().st_mtime >= excel_file.stat().st_mtime:
+        return parquet_file
+
+    print(f"🔄 Converting {excel_file} to Parquet: {parquet_file}")
+    source = sql_literal(excel_file)
+    target = sql_literal(parquet_file)
+    try:
+        # read_xlsx streams straight into the Parquet writer, nothing is materialized in Python
+        con.execute("INSTALL excel; LOAD excel;")
+        con.execute(f"COPY (SELECT * FROM read_xlsx({source})) TO {target} (FORMAT PARQUET, COMPRESSION ZSTD)")
+    except duckdb.Error as e:
+        print(f"⚠️  DuckDB read_xlsx unavailable ({e}), falling back to pandas")
+        con.register('_excel_source', pa.Table.from_pandas(pd.read_excel(excel_file), preserve_index=False))
+        try:
+            con.execute(f"COPY (SELECT * FROM _excel_source) TO {target} (FORMAT PARQUET, COMPRESSION ZSTD)")
+        finally:
+            con.unregister('_excel_source')
+
+    return parquet_file
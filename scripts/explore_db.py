@@ -18,27 +18,30 @@ def show_summary(con):
     print("📊 DATABASE SUMMARY")
     print("=" * 60)
     
-    # Counts by layer
-    raw_count = con.execute("SELECT COUNT(*) FROM raw.raw_loans").fetchone()[0]
-    silver_count = con.execute("SELECT COUNT(*) FROM main_silver.silver_loans").fetchone()[0]
-    fact_count = con.execute("SELECT COUNT(*) FROM main_gold.fact_loan").fetchone()[0]
-    customer_count = con.execute("SELECT COUNT(*) FROM main_gold.dim_customer").fetchone()[0]
-    purpose_count = con.execute("SELECT COUNT(*) FROM main_gold.dim_purpose").fetchone()[0]
-    
-    print(f"🔴 RAW Layer: {raw_count:,} records")
-    print(f"🟡 SILVER Layer: {silver_count:,} records (after deduplication)")
+    # Layer counts and loan status breakdown in one round-trip, split by section
+    rows = con.execute("""
+        SELECT 'count' AS section, 'raw' AS label, COUNT(*) AS n, NULL AS pct FROM raw.raw_loans
+        UNION ALL SELECT 'count', 'silver', COUNT(*), NULL FROM main_silver.silver_loans
+        UNION ALL SELECT 'count', 'fact', COUNT(*), NULL FROM main_gold.fact_loan
+        UNION ALL SELECT 'count', 'customer', COUNT(*), NULL FROM main_gold.dim_customer
+        UNION ALL SELECT 'count', 'purpose', COUNT(*), NULL FROM main_gold.dim_purpose
+        UNION ALL (
+            WITH g AS (SELECT loan_status, COUNT(*) AS c FROM main_gold.fact_loan GROUP BY loan_status),
+                 t AS (SELECT SUM(c) AS s FROM g)
+            SELECT 'loan_status', loan_status, c, ROUND(c * 100.0 / s, 2)
+            FROM g CROSS JOIN t
+        )
+    """).arrow().to_pylist()
+    
+    counts = {r['label']: r['n'] for r in rows if r['section'] == 'count'}
+    loan_status = [(r['label'], r['n'], r['pct']) for r in rows if r['section'] == 'loan_status']
+    
+    print(f"🔴 RAW Layer: {counts['raw']:,} records")
+    print(f"🟡 SILVER Layer: {counts['silver']:,} records (after deduplication)")
     print(f"🟢 GOLD Layer:")
-    print(f"   - Fact Table: {fact_count:,} records")
-    print(f"   - Dim Customer: {customer_count:,} unique customers")
-    print(f"   - Dim Purpose: {purpose_count} unique purposes")
-    
-    # Loan status statistics
-    loan_status = con.execute("""
-        SELECT loan_status, COUNT(*) as count, 
-               ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 2) as percentage
-        FROM main_gold.fact_loan 
-        GROUP BY loan_status
-    """).fetchall()
+    print(f"   - Fact Table: {counts['fact']:,} records")
+    print(f"   - Dim Customer: {counts['customer']:,} unique customers")
+    print(f"   - Dim Purpose: {counts['purpose']} unique purposes")
     
     print(f"\n📈 Loan Status:")
     for status, count, pct in loan_status:
@@ -51,11 +54,15 @@ def show_purpose_analysis(con):
     print("=" * 60)
     
     purposes = con.execute("""
-        SELECT p.purpose_name, COUNT(*) as count,
-               ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 2) as percentage
-        FROM main_gold.fact_loan f 
-        JOIN main_gold.dim_purpose p ON f.purpose_id = p.purpose_id 
-        GROUP BY p.purpose_name 
+        WITH g AS (
+            SELECT p.purpose_name, COUNT(*) as count
+            FROM main_gold.fact_loan f 
+            JOIN main_gold.dim_purpose p ON f.purpose_id = p.purpose_id 
+            GROUP BY p.purpose_name
+        ),
+        t AS (SELECT SUM(count) as total FROM g)
+        SELECT purpose_name, count, ROUND(count * 100.0 / total, 2) as percentage
+        FROM g CROSS JOIN t
         ORDER BY count DESC
     """).fetchall()
     
@@ -86,20 +93,25 @@ def show_credit_analysis(con):
     
     # Credit score distribution
     credit_dist = con.execute("""
-        SELECT 
-            CASE 
-                WHEN credit_score < 580 THEN 'Poor (<580)'
-                WHEN credit_score < 670 THEN 'Fair (580-669)'
-                WHEN credit_score < 740 THEN 'Good (670-739)'
-                WHEN credit_score < 800 THEN 'Very Good (740-799)'
-                ELSE 'Excellent (800+)'
-            END as credit_category,
-            COUNT(*) as count,
-            ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 2) as percentage
-        FROM main_gold.fact_loan
-        WHERE credit_score IS NOT NULL
-        GROUP BY 1
-        ORDER BY MIN(credit_score)
+        WITH g AS (
+            SELECT 
+                CASE 
+                    WHEN credit_score < 580 THEN 'Poor (<580)'
+                    WHEN credit_score < 670 THEN 'Fair (580-669)'
+                    WHEN credit_score < 740 THEN 'Good (670-739)'
+                    WHEN credit_score < 800 THEN 'Very Good (740-799)'
+                    ELSE 'Excellent (800+)'
+                END as credit_category,
+                COUNT(*) as count,
+                MIN(credit_score) as min_score
+            FROM main_gold.fact_loan
+            WHERE credit_score IS NOT NULL
+            GROUP BY 1
+        ),
+        t AS (SELECT SUM(count) as total FROM g)
+        SELECT credit_category, count, ROUND(count * 100.0 / total, 2) as percentage
+        FROM g CROSS JOIN t
+        ORDER BY min_score
     """).fetchall()
     
     print(f"\n📊 Credit Score Distribution:")
@@ -135,10 +147,14 @@ def show_home_ownership_analysis(con):
     print("=" * 60)
     
     home_ownership = con.execute("""
-        SELECT home_ownership, COUNT(*) as count,
-               ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 2) as percentage
-        FROM main_gold.dim_customer
-        GROUP BY home_ownership
+        WITH g AS (
+            SELECT home_ownership, COUNT(*) as count
+            FROM main_gold.dim_customer
+            GROUP BY home_ownership
+        ),
+        t AS (SELECT SUM(count) as total FROM g)
+        SELECT home_ownership, count, ROUND(count * 100.0 / total, 2) as percentage
+        FROM g CROSS JOIN t
         ORDER BY count DESC
     """).fetchall()
     
@@ -157,38 +173,56 @@ def show_null_analysis(con):
         'months_since_last_delinquent', 'bankruptcies', 'tax_liens'
     ]
     
-    for field in null_fields:
-        result = con.execute(f"""
-            SELECT 
-                COUNT(*) as total,
-                COUNT(*) FILTER (WHERE {field} IS NULL) as null_count,
-                ROUND(COUNT(*) FILTER (WHERE {field} IS NULL) * 100.0 / COUNT(*), 2) as null_percentage
-            FROM main_gold.fact_loan
-        """).fetchone()
-        
-        total, null_count, null_pct = result
+    # Only fields present in the fact table (job tenure lives on dim_customer)
+    existing = {row[0] for row in con.execute("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = 'main_gold' AND table_name = 'fact_loan'
+    """).fetchall()}
+    null_fields = [f for f in null_fields if f in existing]
+    
+    # All NULL counts in a single scan of the fact table
+    select_list = ", ".join(f'COUNT_IF("{f}" IS NULL)' for f in null_fields)
+    total, *null_counts = con.execute(
+        f"SELECT COUNT(*), {select_list} FROM main_gold.fact_loan"
+    ).fetchone()
+    
+    for field, null_count in zip(null_fields, null_counts):
+        null_pct = round(null_count * 100.0 / total, 2) if total else 0.0
         print(f"   - {field}: {null_count:,} NULLs ({null_pct}%) of {total:,} total")
 
+def fetch_sample_arrow(con, table, n=3):
+    """First n rows of a table as an Arrow table"""
+    return con.execute(f"SELECT * FROM {table} LIMIT ?", [n]).arrow()
+
+def format_arrow_table(table):
+    """Render an Arrow table as aligned text lines
+
+    Values come from to_pylist, so integer columns with NULLs stay integers
+    (pandas would turn them into floats/NaN).
+    """
+    header = table.column_names
+    rows = [["NULL" if v is None else str(v) for v in row.values()] for row in table.to_pylist()]
+    widths = [max([len(name)] + [len(row[i]) for row in rows]) for i, name in enumerate(header)]
+    return [
+        " ".join(value.rjust(width) for value, width in zip(line, widths))
+        for line in [header] + rows
+    ]
+
 def show_sample_data(con):
     """Show sample data from each layer"""
     print("\n" + "=" * 60)
     print("📋 SAMPLE DATA")
     print("=" * 60)
     
-    print("\n🔴 RAW Layer Sample (first 3 records):")
-    raw_sample = con.execute("SELECT * FROM raw.raw_loans LIMIT 3").fetchall()
-    for row in raw_sample:
-        print(f"   {row}")
-    
-    print("\n🟡 SILVER Layer Sample (first 3 records):")
-    silver_sample = con.execute("SELECT * FROM main_silver.silver_loans LIMIT 3").fetchall()
-    for row in silver_sample:
-        print(f"   {row}")
-    
-    print("\n🟢 GOLD Layer Sample (first 3 records):")
-    gold_sample = con.execute("SELECT * FROM main_gold.fact_loan LIMIT 3").fetchall()
-    for row in gold_sample:
-        print(f"   {row}")
+    layers = [
+        ("🔴 RAW", "raw.raw_loans"),
+        ("🟡 SILVER", "main_silver.silver_loans"),
+        ("🟢 GOLD", "main_gold.fact_loan"),
+    ]
+    for label, table in layers:
+        print(f"\n{label} Layer Sample (first 3 records):")
+        for line in format_arrow_table(fetch_sample_arrow(con, table)):
+            print(f"   {line}")
 
 def main():
     """Main function"""
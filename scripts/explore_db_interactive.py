@@ -7,6 +7,10 @@ import duckdb
 import pandas as pd
 from pathlib import Path
 
+# Custom query output is fetched in batches of this size, up to a hard cap
+PREVIEW_BATCH_ROWS = 1024
+MAX_PREVIEW_ROWS = 10_000
+
 def connect_db():
     """Connect to DuckDB database"""
     db_path = Path(__file__).parent.parent / "dbt" / "data_challenge.duckdb"
@@ -25,11 +29,15 @@ def show_schemas_and_tables(con):
     
     print("\nTables:")
     tables = con.execute("""
-        SELECT table_schema, table_name, 
-               (SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = t.table_schema AND table_name = t.table_name) as column_count
-        FROM information_schema.tables t 
-        WHERE table_schema NOT IN ('information_schema', 'pg_catalog')
-        ORDER BY table_schema, table_name
+        SELECT t.table_schema, t.table_name, COALESCE(c.column_count, 0) as column_count
+        FROM information_schema.tables t
+        LEFT JOIN (
+            SELECT table_schema, table_name, COUNT(*) as column_count
+            FROM information_schema.columns
+            GROUP BY table_schema, table_name
+        ) c USING (table_schema, table_name)
+        WHERE t.table_schema NOT IN ('information_schema', 'pg_catalog')
+        ORDER BY t.table_schema, t.table_name
     """).fetchall()
     
     for schema, table, cols in tables:
@@ -58,7 +66,8 @@ def show_table_info(con, schema, table):
     
     # Show sample data
     print(f"\nSample data (first 5 rows):")
-    sample = con.execute(f"SELECT * FROM {schema}.{table} LIMIT 5").fetchdf()
+    # Arrow first; self_destruct frees each Arrow buffer as pandas takes it over
+    sample = con.execute(f"SELECT * FROM {schema}.{table} LIMIT 5").arrow().to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
     print(sample.to_string(index=False))
 
 def interactive_menu():
@@ -117,11 +126,33 @@ def custom_query(con):
         return
     
     try:
-        result = con.execute(query).fetchdf()
-        print(f"\n✅ Query executed successfully ({len(result)} rows):")
-        print(result.to_string(index=False))
+        # Stream the result in Arrow batches so large results are never fully materialized
+        reader = con.execute(query).fetch_record_batch(rows_per_batch=PREVIEW_BATCH_ROWS)
     except Exception as e:
         print(f"❌ Error executing query: {e}")
+        return
+    
+    print(f"\n✅ Query executed successfully:")
+    shown = 0
+    try:
+        batches = iter(reader)
+        batch = next(batches, None)
+        while batch is not None:
+            print(batch.to_pandas(types_mapper=pd.ArrowDtype).to_string(index=False))
+            shown += batch.num_rows
+            batch = next(batches, None)
+            if batch is None:
+                break
+            if shown >= MAX_PREVIEW_ROWS:
+                print(f"⚠️  Output capped at {MAX_PREVIEW_ROWS:,} rows, add a LIMIT to narrow the query")
+                break
+            if input(f"\nShown {shown:,} rows. Show more? (y/N): ").strip().lower() != "y":
+                break
+    except Exception as e:
+        print(f"❌ Error reading query results: {e}")
+    finally:
+        reader.close()
+    print(f"({shown:,} rows shown)")
 
 def main():
     """Main function"""
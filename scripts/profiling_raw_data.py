@@ -4,14 +4,35 @@ Data Profiling Script - RAW Data Analysis
 This script analyzes the raw Excel data BEFORE any pipeline processing
 """
 
+import os
+import duckdb
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from excel_cache import ensure_parquet
 import warnings
 warnings.filterwarnings('ignore')
 
+# Set PROFILE_APPROX_DUPLICATES=true on very large files to estimate distinct rows
+# with HyperLogLog (approx_count_distinct) instead of an exact COUNT(DISTINCT)
+APPROX_DUPLICATES = os.getenv('PROFILE_APPROX_DUPLICATES', 'false').lower() == 'true'
+
+def matching_values(values, pattern):
+    """Values of an Arrow string array matching a case-insensitive regex"""
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        return []
+    return values.filter(pc.match_substring_regex(values, pattern, ignore_case=True)).to_pylist()
+
+def value_frequencies(column):
+    """Distinct values of an Arrow column and their counts, most frequent first (stable on ties)"""
+    value_counts = pc.value_counts(column)
+    order = pc.array_sort_indices(value_counts.field('counts'), order='descending')
+    return value_counts.field('values').take(order), value_counts.field('counts').take(order)
+
 def profile_raw_data():
     """Profile the raw Excel data before any processing"""
     
@@ -29,27 +50,38 @@ def profile_raw_data():
         return
     
     print(f"📁 Loading raw data from: {excel_file}")
-    df = pd.read_excel(excel_file)
+    con = duckdb.connect()
+    parquet_file = ensure_parquet(con, excel_file)
+    table = con.execute("SELECT * FROM read_parquet(?)", [str(parquet_file)]).arrow()
+    con.register('raw', table)
     
     print(f"📊 Raw Data Overview:")
-    print(f"  Rows: {len(df):,}")
-    print(f"  Columns: {df.shape[1]}")
-    print(f"  Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    print(f"  Rows: {table.num_rows:,}")
+    print(f"  Columns: {table.num_columns}")
+    print(f"  Memory Usage: {table.nbytes / 1024**2:.2f} MB")
     
     # Data types
     print(f"\n📋 Data Types:")
-    print(df.dtypes)
+    # pandas dtypes of an empty table with the same schema, the data itself is never converted
+    print(table.schema.empty_table().to_pandas().dtypes)
     
     # Duplicate analysis
-    duplicates = df.duplicated().sum()
-    print(f"\n🔄 Duplicate Analysis:")
-    print(f"  Total Duplicates: {duplicates:,} ({duplicates/len(df)*100:.2f}%)")
-    print(f"  Unique Records: {len(df) - duplicates:,}")
+    # Distinct 64-bit row hashes in a single aggregate (NULLs hash equal, same as
+    # pandas duplicated()); HyperLogLog estimate when PROFILE_APPROX_DUPLICATES is set
+    distinct_expr = "approx_count_distinct(hash(*COLUMNS(*)))" if APPROX_DUPLICATES else "COUNT(DISTINCT hash(*COLUMNS(*)))"
+    total, distinct_rows = con.execute(f"SELECT COUNT(*), {distinct_expr} FROM raw").fetchone()
+    duplicates = max(total - distinct_rows, 0)  # the estimate can exceed COUNT(*)
+    print(f"\n🔄 Duplicate Analysis{' (approximate)' if APPROX_DUPLICATES else ''}:")
+    print(f"  Total Duplicates: {duplicates:,} ({duplicates/total*100:.2f}%)")
+    print(f"  Unique Records: {total - duplicates:,}")
     
     # NULL analysis
     print(f"\n🔍 NULL Value Analysis:")
-    null_analysis = df.isnull().sum().sort_values(ascending=False)
-    null_percentage = (null_analysis / len(df) * 100).round(2)
+    # Arrow keeps a per-column null count, no need to scan the values
+    null_analysis = pd.Series(
+        {name: column.null_count for name, column in zip(table.column_names, table.columns)}
+    ).sort_values(ascending=False)
+    null_percentage = (null_analysis / table.num_rows * 100).round(2)
     
     null_summary = pd.DataFrame({
         'Column': null_analysis.index,
@@ -63,57 +95,66 @@ def profile_raw_data():
     print(f"\n📊 Outlier Analysis:")
     numerical_fields = ['Current Loan Amount', 'Credit Score', 'Annual Income', 'Monthly Debt']
     
-    for field in numerical_fields:
-        if field in df.columns:
-            data = df[field].dropna()
-            if len(data) > 0:
-                Q1 = data.quantile(0.25)
-                Q3 = data.quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = data[(data < lower_bound) | (data > upper_bound)]
-                
-                print(f"\n{field}:")
-                print(f"  Range: {data.min():,.0f} - {data.max():,.0f}")
-                print(f"  Outliers: {len(outliers):,} ({len(outliers)/len(data)*100:.2f}%)")
-                print(f"  IQR: {IQR:,.0f}")
-                
-                # Check for sentinel values
-                if field == 'Current Loan Amount':
-                    sentinel_99999999 = (data == 99999999).sum()
-                    if sentinel_99999999 > 0:
-                        print(f"  ⚠️  Sentinel Value (99,999,999): {sentinel_99999999:,} records")
-                
-                if field == 'Credit Score':
-                    high_scores = (data > 900).sum()
-                    if high_scores > 0:
-                        print(f"  ⚠️  High Scores (>900): {high_scores:,} records (likely x10 scale)")
+    fields = [field for field in numerical_fields if field in table.column_names]
+    casts = ", ".join(f'CAST("{field}" AS DOUBLE) AS "{field}"' for field in fields)
+    
+    # Quartiles, ranges and flag counts for every field in one query
+    # (UNPIVOT drops NULLs, matching the former dropna())
+    stats = {row[0]: row[1:] for row in con.execute(f"""
+        WITH u AS (
+            UNPIVOT (SELECT {casts} FROM raw) ON COLUMNS(*) INTO NAME field VALUE v
+        ),
+        q AS (
+            SELECT field, quantile_cont(v, 0.25) AS q1, quantile_cont(v, 0.75) AS q3
+            FROM u GROUP BY field
+        )
+        SELECT field, MIN(v), MAX(v), COUNT(*), q3 - q1,
+               COUNT_IF(v < q1 - 1.5 * (q3 - q1) OR v > q3 + 1.5 * (q3 - q1)),
+               COUNT_IF(v = 99999999),
+               COUNT_IF(v > 900)
+        FROM u JOIN q USING (field)
+        GROUP BY field, q1, q3
+    """).fetchall()}
+    
+    for field in fields:
+        if field in stats:
+            min_v, max_v, count, IQR, outliers, sentinel_99999999, high_scores = stats[field]
+            
+            print(f"\n{field}:")
+            print(f"  Range: {min_v:,.0f} - {max_v:,.0f}")
+            print(f"  Outliers: {outliers:,} ({outliers/count*100:.2f}%)")
+            print(f"  IQR: {IQR:,.0f}")
+            
+            # Check for sentinel values
+            if field == 'Current Loan Amount' and sentinel_99999999 > 0:
+                print(f"  ⚠️  Sentinel Value (99,999,999): {sentinel_99999999:,} records")
+            
+            if field == 'Credit Score' and high_scores > 0:
+                print(f"  ⚠️  High Scores (>900): {high_scores:,} records (likely x10 scale)")
     
     # Categorical analysis
     print(f"\n🏷️ Categorical Data Analysis:")
     categorical_fields = ['Home Ownership', 'Purpose', 'Years in current job', 'Loan Status']
     
     for field in categorical_fields:
-        if field in df.columns:
+        if field in table.column_names:
             print(f"\n{field}:")
-            value_counts = df[field].value_counts(dropna=False)
-            print(value_counts.head(10))
+            values, counts = value_frequencies(table[field])
+            print(pd.Series(counts.to_pylist(), index=pd.Index(values.to_pylist(), name=field), name='count').head(10))
             
             # Check for inconsistencies
             if field == 'Home Ownership':
-                mortgage_variants = [v for v in value_counts.index if 'mortgage' in str(v).lower()]
+                mortgage_variants = matching_values(values, 'mortgage')
                 if len(mortgage_variants) > 1:
                     print(f"  ⚠️  Inconsistent mortgage values: {mortgage_variants}")
             
             if field == 'Purpose':
-                purpose_variants = [v for v in value_counts.index if 'other' in str(v).lower()]
+                purpose_variants = matching_values(values, 'other')
                 if len(purpose_variants) > 1:
                     print(f"  ⚠️  Inconsistent 'other' values: {purpose_variants}")
             
             if field == 'Years in current job':
-                text_values = [v for v in value_counts.index if isinstance(v, str) and any(char.isalpha() for char in str(v))]
+                text_values = matching_values(values, '[a-z]')
                 if text_values:
                     print(f"  ⚠️  Text values that need parsing: {text_values[:5]}")
     
@@ -121,26 +162,27 @@ def profile_raw_data():
     print(f"\n📈 Business Insights:")
     
     # Loan status distribution
-    if 'Loan Status' in df.columns:
-        loan_status = df['Loan Status'].value_counts(normalize=True) * 100
+    if 'Loan Status' in table.column_names:
+        statuses, counts = value_frequencies(table['Loan Status'].drop_null())
+        shares = counts.to_numpy() / counts.to_numpy().sum() * 100
         print(f"\nLoan Status Distribution:")
-        for status, pct in loan_status.items():
+        for status, pct in zip(statuses.to_pylist(), shares):
             print(f"  {status}: {pct:.1f}%")
     
     # Credit score insights
-    if 'Credit Score' in df.columns:
-        credit_data = df['Credit Score'].dropna()
+    if 'Credit Score' in table.column_names:
+        credit_data = table['Credit Score'].drop_null().to_numpy()
         print(f"\nCredit Score Insights:")
         print(f"  Average: {credit_data.mean():.1f}")
-        print(f"  Median: {credit_data.median():.1f}")
+        print(f"  Median: {np.median(credit_data):.1f}")
         print(f"  Range: {credit_data.min()} - {credit_data.max()}")
     
     # Purpose analysis
-    if 'Purpose' in df.columns:
-        purpose_counts = df['Purpose'].value_counts()
+    if 'Purpose' in table.column_names:
+        purposes, counts = value_frequencies(table['Purpose'].drop_null())
         print(f"\nTop Loan Purposes:")
-        for purpose, count in purpose_counts.head(5).items():
-            pct = count / len(df) * 100
+        for purpose, count in zip(purposes[:5].to_pylist(), counts[:5].to_pylist()):
+            pct = count / table.num_rows * 100
             print(f"  {purpose}: {count:,} ({pct:.1f}%)")
     
     # Data quality recommendations
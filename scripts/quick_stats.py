@@ -3,8 +3,9 @@
 Script simple para ver estadísticas rápidas de los datos
 """
 
-import pandas as pd
+import duckdb
 from pathlib import Path
+from excel_cache import ensure_parquet
 
 def show_stats():
     """Muestra estadísticas básicas de los datos"""
@@ -26,21 +27,26 @@ def show_stats():
     
     # Procesar cada archivo Excel
     total_records = 0
+    con = duckdb.connect()
     for excel_file in excel_files:
         try:
             print(f"\n📄 Procesando: {excel_file.name}")
-            df = pd.read_excel(excel_file)
+            # Consultar la copia Parquet: COUNT(*) sale de los metadatos del footer
+            parquet_file = str(ensure_parquet(con, excel_file))
+            num_rows = con.execute("SELECT COUNT(*) FROM read_parquet(?)", [parquet_file]).fetchone()[0]
+            sample = con.execute("SELECT * FROM read_parquet(?) LIMIT 2", [parquet_file]).arrow()
+            columns = sample.column_names
             
-            print(f"  Filas: {len(df):,}")
-            print(f"  Columnas: {len(df.columns)}")
-            print(f"  Columnas: {', '.join(df.columns[:5])}{'...' if len(df.columns) > 5 else ''}")
+            print(f"  Filas: {num_rows:,}")
+            print(f"  Columnas: {len(columns)}")
+            print(f"  Columnas: {', '.join(columns[:5])}{'...' if len(columns) > 5 else ''}")
             
             # Mostrar algunos datos de ejemplo
             print(f"  Ejemplo de datos:")
-            for i, row in df.head(2).iterrows():
-                print(f"    Fila {i+1}: {dict(row.head(3))}")
+            for i, row in enumerate(sample.select(columns[:3]).to_pylist()):
+                print(f"    Fila {i+1}: {row}")
             
-            total_records += len(df)
+            total_records += num_rows
             
         except Exception as e:
             print(f"  ❌ Error leyendo {excel_file.name}: {e}")
@@ -5,25 +5,31 @@ Script to demonstrate different ingestion modes:
 - Incremental: Append new data from Excel files in data directory
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and print results"""
+import duckdb
+
+# Make the ingest package importable when run as `python scripts/run_ingestion_modes.py`
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(_PROJECT_ROOT))
+
+import ingest.ingest_excel_to_duckdb as ingest_module
+
+def run_ingestion(ingest_args, description, con):
+    """Run the ingestion in-process on a shared connection and print results"""
     print(f"\n🚀 {description}")
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Arguments: {' '.join(ingest_args)}")
     print("-" * 60)
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        ingest_module.main(ingest_module.parser.parse_args(ingest_args), con)
         print("✅ SUCCESS")
-        print(result.stdout)
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print("❌ FAILED")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+        print(f"ERROR: {e}")
         return False
 
 def main():
@@ -65,18 +71,21 @@ def main():
     print("- Create a fresh RAW layer")
     print("- Use: --excel (single file)")
     
-    cmd_full_refresh = [
-        "python", str(ingest_script),
+    # Both modes share one connection instead of spawning a Python process each
+    con = duckdb.connect(str(duckdb_path))
+    
+    args_full_refresh = [
         "--excel", str(excel_file),
         "--duckdb", str(duckdb_path),
         "--raw_dir", str(raw_dir),
         "--mode", "full_refresh"
     ]
     
-    success_full = run_command(cmd_full_refresh, "Full Refresh Ingestion")
+    success_full = run_ingestion(args_full_refresh, "Full Refresh Ingestion", con)
     
     if not success_full:
         print("❌ Full refresh failed. Stopping demo.")
+        con.close()
         sys.exit(1)
     
     # Mode 2: Incremental
@@ -88,17 +97,18 @@ def main():
     print("- Process all Excel files in the data directory")
     print("- Add metadata columns (_source_file, _ingestion_timestamp)")
     print("- Use: --excel_dir (directory) + --excel_pattern (optional)")
-    print("\n💡 Note: Since we only have one Excel file, this will just append the same data")
+    print("- Skip files already ingested unchanged (tracked in raw._ingestion_log)")
+    print("\n💡 Note: The full refresh above logged the main Excel file, so only new or changed files are appended")
     
-    cmd_incremental = [
-        "python", str(ingest_script),
+    args_incremental = [
         "--excel_dir", str(excel_dir),
         "--duckdb", str(duckdb_path),
         "--raw_dir", str(raw_dir),
         "--mode", "incremental"
     ]
     
-    success_incremental = run_command(cmd_incremental, "Incremental Ingestion")
+    success_incremental = run_ingestion(args_incremental, "Incremental Ingestion", con)
+    con.close()
     
     # Summary
     print("\n" + "=" * 60)
@@ -1,14 +1,44 @@
 import argparse
 import os
 import subprocess
+import sys
 from pathlib import Path
 
+try:
+    from dbt.cli.main import dbtRunner
+except Exception:
+    dbtRunner = None
+
+# Importar el módulo de ingesta (raíz del repo en sys.path)
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+import ingest.ingest_excel_to_duckdb as ingest_module
+
 
 def run(cmd: list[str], cwd: str | None = None) -> None:
     print("$", " ".join(cmd))
     subprocess.run(cmd, cwd=cwd, check=True)
 
 
+def run_dbt(runner, args: list[str], dbt_dir: Path) -> None:
+    """Ejecuta dbt en el mismo proceso (dbtRunner) o como subproceso si no está disponible"""
+    if runner is None:
+        run(['dbt', *args], cwd=str(dbt_dir))
+        return
+    print("$ dbt", " ".join(args))
+    # cwd = dbt/ como con el subproceso: profiles.yml y la ruta relativa de DuckDB dependen de ello
+    previous_cwd = os.getcwd()
+    os.chdir(dbt_dir)
+    try:
+        result = runner.invoke(args)
+    finally:
+        os.chdir(previous_cwd)
+    if not result.success:
+        raise SystemExit(f"Error: dbt {' '.join(args)} falló: {result.exception or 'ver logs'}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description='Run end-to-end pipeline: ingest → dbt run/test')
     parser.add_argument('--excel', default='data/Data Engineer Challenge.xlsx', help='Ruta al Excel fuente')
@@ -20,12 +50,11 @@ def main() -> None:
     parser.add_argument('--select', default='stg:* core:*', help='Selector dbt (run)')
     args = parser.parse_args()
 
-    repo_root = Path(__file__).resolve().parents[1]
+    repo_root = REPO_ROOT
 
-    # 1) Ingesta a RAW (Parquet local + tabla raw.* en DuckDB)
-    ingest_script = repo_root / 'ingest' / 'ingest_excel_to_duckdb.py'
-    ingest_cmd = [
-        'python', str(ingest_script),
+    # 1) Ingesta a RAW (Parquet local + tabla raw.* en DuckDB), en proceso;
+    #    main() cierra su conexión antes de que dbt abra el archivo
+    ingest_args = [
         '--excel', str(repo_root / args.excel),
         '--duckdb', str(repo_root / args.duckdb),
         '--raw_dir', str(repo_root / args.raw_dir),
@@ -33,14 +62,16 @@ def main() -> None:
     if args.prod:
         if not args.s3_bucket:
             raise SystemExit('Error: --prod requiere --s3_bucket o env RAW_S3_BUCKET')
-        ingest_cmd += ['--prod', '--s3_bucket', args.s3_bucket, '--s3_prefix', args.s3_prefix]
-    run(ingest_cmd)
+        ingest_args += ['--prod', '--s3_bucket', args.s3_bucket, '--s3_prefix', args.s3_prefix]
+    print("$ ingest", " ".join(ingest_args))
+    ingest_module.main(ingest_module.parser.parse_args(ingest_args))
 
-    # 2) dbt deps + run + test
+    # 2) dbt deps + run + test (un solo dbtRunner para los tres comandos)
     dbt_dir = repo_root / 'dbt'
-    run(['dbt', 'deps'], cwd=str(dbt_dir))
-    run(['dbt', 'run', '--select', args.select], cwd=str(dbt_dir))
-    run(['dbt', 'test'], cwd=str(dbt_dir))
+    runner = dbtRunner() if dbtRunner is not None else None
+    run_dbt(runner, ['deps'], dbt_dir)
+    run_dbt(runner, ['run', '--select', args.select], dbt_dir)
+    run_dbt(runner, ['test'], dbt_dir)
 
     print('✅ Pipeline completo')
 
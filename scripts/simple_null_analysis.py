@@ -3,14 +3,146 @@
 Simple NULL Analysis Script
 """
 
+import functools
+import hashlib
+import json
+import os
 import duckdb
+from duckdb_utils import connect
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DB_PATH = 'dbt/data_challenge.duckdb'
+
+# Results are cached per table and reused while the database file is unchanged
+CACHE_DIR = Path(os.getenv('NULL_ANALYSIS_CACHE_DIR', Path.home() / '.cache' / 'null_analysis'))
+
+def quote_ident(name):
+    """Double-quote a SQL identifier, escaping embedded quotes"""
+    return '"' + name.replace('"', '""') + '"'
+
+@functools.lru_cache(maxsize=32)
+def get_columns(con, schema, table):
+    """(column name, nullable) pairs of a table, looked up in information_schema once per connection"""
+    return tuple((name, is_nullable == 'YES') for name, is_nullable in con.execute("""
+        SELECT column_name, is_nullable
+        FROM information_schema.columns
+        WHERE table_schema = ? AND table_name = ?
+        ORDER BY ordinal_position
+    """, [schema, table]).fetchall())
+
+def storage_null_flags(con, schema, table):
+    """Columns whose validity segment stats prove no NULLs / only NULLs, from PRAGMA storage_info
+
+    Returns two sets of column names. Columns with non-persistent or updated segments
+    are left out of both (their stats may be stale), as is everything if the pragma fails.
+    """
+    try:
+        rows = con.execute("""
+            SELECT column_name,
+                   bool_and(persistent AND NOT has_updates),
+                   bool_and(stats LIKE '%Has Null: false%'),
+                   bool_and(stats LIKE '%Has No Null: false%')
+            FROM pragma_storage_info(?)
+            WHERE segment_type = 'VALIDITY' AND column_path = '[' || column_id || ', 0]'
+            GROUP BY column_name
+        """, [f"{quote_ident(schema)}.{quote_ident(table)}"]).fetchall()
+    except duckdb.Error:
+        return set(), set()
+    
+    no_nulls = {name for name, reliable, has_no_null, _ in rows if reliable and has_no_null}
+    all_nulls = {name for name, reliable, _, all_null in rows if reliable and all_null}
+    return no_nulls, all_nulls
+
+def collect_table_nulls(con, schema, table, columns):
+    """Row count of a table and the NULL counts of the given columns, in one scan"""
+    # All columns in a single aggregation: one table scan instead of one per column
+    # (percentages are derived in Python from the one shared COUNT(*)).
+    # NOT NULL columns cannot hold NULLs, and columns whose storage stats show no NULLs
+    # or only NULLs are answered from those stats, so all of them are left out of the scan.
+    no_nulls, all_nulls = storage_null_flags(con, schema, table)
+    nullable = [
+        column_name for column_name, is_nullable in columns
+        if is_nullable and column_name not in no_nulls and column_name not in all_nulls
+    ]
+    null_exprs = [
+        f"COUNT(*) FILTER (WHERE {quote_ident(column_name)} IS NULL)"
+        for column_name in nullable
+    ]
+    # Single-row Arrow result: typed columns instead of a boxed Python tuple
+    result = con.execute(
+        f"SELECT {', '.join(['COUNT(*)', *null_exprs])} FROM {quote_ident(schema)}.{quote_ident(table)}"
+    ).arrow()
+    total_rows, *null_counts = (column[0].as_py() for column in result.columns)
+    counts = dict(zip(nullable, null_counts))
+    counts.update(dict.fromkeys(all_nulls, total_rows))
+    
+    return total_rows, [
+        (null_count, round(null_count * 100.0 / total_rows, 2) if total_rows else 0.0)
+        for null_count in (counts.get(column_name, 0) for column_name, _ in columns)
+    ]
+
+def results_cache_file(schema, table, columns):
+    """Cache file for a table's results, keyed on the database file version and the column list"""
+    parts = [f"{schema}.{table}", repr(columns)]
+    for path in (Path(DB_PATH), Path(DB_PATH + '.wal')):
+        if path.exists():
+            stat = path.stat()
+            parts.append(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    key = hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+def analyze_table_in_cursor(con, schema, table, columns):
+    """Run collect_table_nulls on a private cursor so both tables can be scanned concurrently
+
+    Skips the scan entirely when the database is unchanged since the last cached run.
+    """
+    cache_file = results_cache_file(schema, table, columns)
+    if cache_file.exists():
+        total_rows, null_counts = json.loads(cache_file.read_text())
+        return total_rows, [tuple(pair) for pair in null_counts]
+    
+    cursor = con.cursor()
+    try:
+        total_rows, null_counts = collect_table_nulls(cursor, schema, table, columns)
+    finally:
+        cursor.close()
+    
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps([total_rows, null_counts]))
+    except OSError as e:
+        print(f"⚠️  Could not cache results for {schema}.{table}: {e}")
+    return total_rows, null_counts
+
+def print_table_nulls(schema, table, columns, future):
+    """Print the columns and the non-zero NULL counts collected for a table"""
+    try:
+        total_rows, null_counts = future.result()
+    except Exception as e:
+        print(f"  Error in {schema}.{table}: {e}")
+        return
+    
+    # Build the whole report first and write it with a single print
+    lines = ["Columns found:"]
+    lines.extend(f"  - {column_name}" for column_name, _ in columns)
+    
+    lines.append("\nNULL Analysis:")
+    lines.extend(
+        f"  {column_name}: {null_count:,} NULLs ({null_percentage}%) of {total_rows:,} total"
+        for (column_name, _), (null_count, null_percentage) in zip(columns, null_counts)
+        if null_count > 0  # If there are NULLs
+    )
+    print("\n".join(lines))
 
 def analyze_nulls_simple():
     """Simple analysis of NULL values"""
     
     try:
-        con = duckdb.connect('dbt/data_challenge.duckdb')
+        con = connect(DB_PATH)
+        # Only aggregates are run, so result order never matters
+        con.execute("SET preserve_insertion_order=false")
         print("✅ Connected to database successfully!")
     except Exception as e:
         print(f"❌ Error connecting to database: {e}")
@@ -19,73 +151,23 @@ def analyze_nulls_simple():
     print("\n🔍 SIMPLE NULL ANALYSIS")
     print("=" * 50)
     
+    # Column lists come from the (cached) catalog lookup on the main connection;
+    # both tables are then scanned in parallel, each on its own cursor, and printed in order
+    raw_columns = get_columns(con, 'raw', 'raw_loans')
+    silver_columns = get_columns(con, 'main_silver', 'silver_loans')
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        raw_future = executor.submit(analyze_table_in_cursor, con, 'raw', 'raw_loans', raw_columns)
+        silver_future = executor.submit(analyze_table_in_cursor, con, 'main_silver', 'silver_loans', silver_columns)
+    
     # Analyze raw.raw_loans
     print("\n📊 RAW.RAW_LOANS - NULL Analysis:")
     print("-" * 40)
-    
-    # Get columns from raw.raw_loans
-    columns = con.execute("""
-        SELECT column_name 
-        FROM information_schema.columns 
-        WHERE table_schema = 'raw' AND table_name = 'raw_loans'
-        ORDER BY ordinal_position
-    """).fetchall()
-    
-    print("Columns found:")
-    for col in columns:
-        print(f"  - {col[0]}")
-    
-    # Analyze NULLs in each column
-    print("\nNULL Analysis:")
-    for col in columns:
-        column_name = col[0]
-        try:
-            result = con.execute(f"""
-                SELECT 
-                    COUNT(*) as total_rows,
-                    COUNT(*) FILTER (WHERE "{column_name}" IS NULL) as null_count,
-                    ROUND(COUNT(*) FILTER (WHERE "{column_name}" IS NULL) * 100.0 / COUNT(*), 2) as null_percentage
-                FROM raw.raw_loans
-            """).fetchone()
-            
-            if result[1] > 0:  # If there are NULLs
-                print(f"  {column_name}: {result[1]:,} NULLs ({result[2]}%) of {result[0]:,} total")
-        except Exception as e:
-            print(f"  Error in {column_name}: {e}")
+    print_table_nulls('raw', 'raw_loans', raw_columns, raw_future)
     
     # Analyze silver.silver_loans
     print("\n📊 MAIN_SILVER.SILVER_LOANS - NULL Analysis:")
     print("-" * 40)
-    
-    # Get columns from silver.silver_loans
-    columns_silver = con.execute("""
-        SELECT column_name 
-        FROM information_schema.columns 
-        WHERE table_schema = 'main_silver' AND table_name = 'silver_loans'
-        ORDER BY ordinal_position
-    """).fetchall()
-    
-    print("Columns found:")
-    for col in columns_silver:
-        print(f"  - {col[0]}")
-    
-    # Analyze NULLs in each column
-    print("\nNULL Analysis:")
-    for col in columns_silver:
-        column_name = col[0]
-        try:
-            result = con.execute(f"""
-                SELECT 
-                    COUNT(*) as total_rows,
-                    COUNT(*) FILTER (WHERE {column_name} IS NULL) as null_count,
-                    ROUND(COUNT(*) FILTER (WHERE {column_name} IS NULL) * 100.0 / COUNT(*), 2) as null_percentage
-                FROM main_silver.silver_loans
-            """).fetchone()
-            
-            if result[1] > 0:  # If there are NULLs
-                print(f"  {column_name}: {result[1]:,} NULLs ({result[2]}%) of {result[0]:,} total")
-        except Exception as e:
-            print(f"  Error in {column_name}: {e}")
+    print_table_nulls('main_silver', 'silver_loans', silver_columns, silver_future)
     
     con.close()
     print("\n✅ Analysis completed")